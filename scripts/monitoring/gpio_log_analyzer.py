@@ -15,11 +15,16 @@ The tool validates consistency rules between consecutive GPIO states.
 """
 
 import argparse
+import io
 import logging
+import mmap
+import os
 import re
 import sys
-from datetime import datetime
-from typing import Optional
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, TextIO
 
 
 # Configure logging
@@ -30,47 +35,403 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled once at import time; matched against raw bytes from the log file.
+# Patterns are kept free of nested or adjacent unbounded quantifiers so a
+# malformed line is rejected in linear time.
+_GPIO_TOKEN_RE = re.compile(rb"GPIO(\d+)=([01])")
+
+# Common timestamp formats (prioritizing the new millisecond format from gpio_monitor.py)
+TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f",  # New format with microseconds/milliseconds (YYYY-MM-DD HH:MM:SS.fff)
+    "%Y-%m-%d %H:%M:%S",  # Standard format without milliseconds
+    "%H:%M:%S.%f",  # Time only with microseconds/milliseconds
+    "%H:%M:%S",  # Time only without milliseconds
+    "%Y/%m/%d %H:%M:%S.%f",  # Alternative date separator with milliseconds
+    "%Y/%m/%d %H:%M:%S",  # Alternative date separator
+    "%d/%m/%Y %H:%M:%S.%f",  # European date format with milliseconds
+    "%d/%m/%Y %H:%M:%S",  # European date format
+)
+
+# One match per line of a memory-mapped log. Well-formed data lines split into the
+# timestamp and GPIO parts; anything else lands in the last group for the slow path.
+_DATA_LINE_RE = re.compile(rb"^(?:([^|\n]*)\|([^\n]*?GPIO[^\n]*)|([^\n]*))$", re.MULTILINE)
+
+# Maps the state digits captured in bulk ingestion to pin column bytes
+_DIGIT_TO_STATE = bytes.maketrans(b"01", b"\x00\x01")
+
+# Typical size of a gpio_monitor.py data line, used to pre-size the columns
+AVG_LINE_BYTES = 80
+MIN_RESERVED_ENTRIES = 1024
+
+# Column value for a pin that is absent from a log line
+MISSING_STATE = -1
+
+# Line numbers fit in 32 bits, half the size of the int64 timestamp column
+LINE_NUMBER_TYPECODE = "i"
+
+# Timestamps are stored as integer milliseconds since the Unix epoch; this
+# marks an entry whose timestamp could not be parsed
+NO_TIMESTAMP = -(1 << 63)
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+# Rise position reported for a falling edge that never returns to 1
+NO_RISE = -1
+
+# Smallest stuck-at-0 threshold; edges-only parsing always keeps samples this far apart
+EDGE_KEEP_GAP_MS = 2000
+
+# Length of "YYYY-MM-DD HH:MM:SS.fff", the format written by gpio_monitor.py
+_ISO_MS_LENGTH = 23
+
+# Newline-separated timestamps that all use the gpio_monitor.py format
+_ISO_MS_COLUMN_RE = re.compile(rb"(?:\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3}(?:\n|\Z))+")
+
+
+def _parse_with_format(timestamp_str: str, fmt: str) -> Optional[datetime]:
+    """Parse a stripped timestamp string with a single format, or return None.
+
+    The gpio_monitor.py format (YYYY-MM-DD HH:MM:SS.fff) is an ISO 8601 subset, so
+    it goes through the C-implemented datetime.fromisoformat instead of strptime.
+    """
+    s = timestamp_str
+    if (
+        fmt == TIMESTAMP_FORMATS[0]
+        and len(s) == _ISO_MS_LENGTH
+        and s[4] == "-"
+        and s[10] == " "
+        and s[19] == "."
+    ):
+        try:
+            timestamp = datetime.fromisoformat(s)
+        except ValueError:
+            timestamp = None
+        # Newer Pythons also accept a trailing "Z"; the log format has no time zone
+        if timestamp is not None and timestamp.tzinfo is None:
+            return timestamp
+    try:
+        return datetime.strptime(s, fmt)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _probe_formats(timestamp_str: str) -> tuple[Optional[datetime], Optional[str]]:
+    """Try each known format in order; return the timestamp and the format that matched.
+
+    Cached because consecutive log lines frequently share the same timestamp text.
+    """
+    for fmt in TIMESTAMP_FORMATS:
+        timestamp = _parse_with_format(timestamp_str, fmt)
+        if timestamp is None:
+            continue
+        # Log successful parsing for millisecond formats (debug level)
+        if ".%f" in fmt:
+            logger.debug(f"Successfully parsed timestamp with precision: {timestamp_str}")
+        return timestamp, fmt
+    return None, None
+
+
+def _parse_ts(
+    timestamp_str: str, detected_fmt: Optional[str] = None
+) -> tuple[Optional[datetime], Optional[str]]:
+    """Parse a stripped timestamp string; return the timestamp and the format used.
+
+    ``detected_fmt`` is the format that matched earlier lines of the same file. It is
+    tried first, and the full TIMESTAMP_FORMATS list is only probed when it fails.
+    """
+    if detected_fmt is not None:
+        timestamp = _parse_with_format(timestamp_str, detected_fmt)
+        if timestamp is not None:
+            return timestamp, detected_fmt
+    return _probe_formats(timestamp_str)
+
+
+def _to_epoch_ms(timestamp: Optional[datetime]) -> int:
+    """Convert a parsed timestamp to integer milliseconds since the Unix epoch."""
+    if timestamp is None:
+        return NO_TIMESTAMP
+    return (timestamp - _EPOCH) // _ONE_MS
+
+
+def _iso_ms_column(timestamp_strs: list[str]) -> Optional[array]:
+    """Convert gpio_monitor.py format timestamps to epoch milliseconds in one pass.
+
+    The caller has already matched every string against _ISO_MS_COLUMN_RE. Returns
+    None if any of them is still not a valid date or time, so they can be parsed
+    one by one instead.
+    """
+    fromisoformat = datetime.fromisoformat
+    try:
+        return array("q", [(fromisoformat(s) - _EPOCH) // _ONE_MS for s in timestamp_strs])
+    except ValueError:
+        return None
+
+
+# Byte value of each state in a pin column, indexed by state
+_STATE_BYTES = (b"\x00", b"\x01")
+
+# Every value a pin column can hold with its byte, in ascending order of value
+_COLUMN_VALUE_BYTES = ((MISSING_STATE, b"\xff"), (0, b"\x00"), (1, b"\x01"))
+
+# Turns a pin column into a presence column: 1 where the pin was logged, 0 where missing
+_PRESENCE = bytes.maketrans(b"\x00\x01\xff", b"\x01\x01\x00")
+
+
+def _column_edges(column: array) -> list[tuple[int, int, int]]:
+    """Return (previous_index, index, state) for every state change in a pin column.
+
+    Entries missing the pin are skipped, so ``previous_index`` is the last entry
+    still holding the old state; the first sample counts as a change with
+    ``previous_index`` set to NO_RISE. The column is searched with bytes.find and
+    bytes.rfind, so only the edges themselves are visited from Python.
+    """
+    data = column.tobytes()
+    present = [pos for pos in map(data.find, _STATE_BYTES) if pos != -1]
+    if not present:
+        return []
+    index = min(present)
+    state = data[index]
+    edges = [(NO_RISE, index, state)]
+    while True:
+        next_state = 1 - state
+        next_index = data.find(_STATE_BYTES[next_state], index)
+        if next_index == -1:
+            return edges
+        previous = data.rfind(_STATE_BYTES[state], index, next_index)
+        edges.append((previous, next_index, next_state))
+        index, state = next_index, next_state
+
+
+def _presence_changes(pin_columns: dict[int, array]) -> list[int]:
+    """Return the entry indices where any pin appears or goes missing, in order.
+
+    These are exactly the entries whose pin set differs from the previous entry's.
+    """
+    changes = set()
+    for column in pin_columns.values():
+        presence = array("b", column.tobytes().translate(_PRESENCE))
+        changes.update(index for _, index, _ in _column_edges(presence)[1:])
+    return sorted(changes)
+
+
+def _fall_rise_pairs(edges: list[tuple[int, int, int]]) -> list[tuple[int, int, int]]:
+    """Return (before_fall, fall, rise) entry indices for every 1->0 edge.
+
+    ``before_fall`` is the last sample at 1 and ``rise`` the first sample back at
+    1, or NO_RISE when the pin never returns.
+    """
+    pairs = []
+    for k, (previous, index, state) in enumerate(edges):
+        if state == 0 and previous != NO_RISE:
+            rise = edges[k + 1][1] if k + 1 < len(edges) else NO_RISE
+            pairs.append((previous, index, rise))
+    return pairs
+
+
+def _timing_violations(
+    pairs: list[tuple[int, int, int]], timestamps_ms: array, min_ms: float, max_ms: float
+) -> list[tuple[int, int, int, int]]:
+    """Return (before_fall, fall, rise, ms_at_0) for returns to 1 outside [min_ms, max_ms].
+
+    Falls that never return or lack a timestamp at either edge are skipped.
+    """
+    return [
+        (before_fall, fall, rise, ms_at_0)
+        for before_fall, fall, rise in pairs
+        if rise != NO_RISE
+        and NO_TIMESTAMP not in (timestamps_ms[fall], timestamps_ms[rise])
+        and not min_ms <= (ms_at_0 := timestamps_ms[rise] - timestamps_ms[fall]) <= max_ms
+    ]
+
+
+def _stuck_at_zero(
+    column: array,
+    timestamps_ms: array,
+    edges: list[tuple[int, int, int]],
+    max_ms: int,
+    dropped_after: frozenset = frozenset(),
+) -> list[tuple[int, int, int]]:
+    """Return (index, next_index, gap_ms) for consecutive 0 samples over ``max_ms`` apart.
+
+    Only the runs at 0 delimited by ``edges`` are walked, and runs whose timestamps
+    all lie within ``max_ms`` of each other are skipped without visiting their
+    samples. Entries in ``dropped_after`` were followed by samples that were not
+    stored, so they are not paired with the next stored entry. The last pair of
+    samples in the log is checked like any other.
+    """
+    data = column.tobytes()
+    gaps = []
+    for k, (_, index, state) in enumerate(edges):
+        if state != 0:
+            continue
+        run_end = edges[k + 1][0] + 1 if k + 1 < len(edges) else len(data)
+        run_times = timestamps_ms[index:run_end]
+        if max(run_times) - min(run_times) <= max_ms:
+            continue
+        position = index
+        while True:
+            next_index = data.find(b"\x00", position + 1, run_end)
+            if next_index == -1:
+                break
+            curr_time, next_time = timestamps_ms[position], timestamps_ms[next_index]
+            if (
+                position not in dropped_after
+                and NO_TIMESTAMP not in (curr_time, next_time)
+                and next_time - curr_time > max_ms
+            ):
+                gaps.append((position, next_index, next_time - curr_time))
+            position = next_index
+    return gaps
+
+
+def _match_followers(
+    lead_falls: list[int],
+    lead_rises: list[int],
+    follow_falls: list[int],
+    follow_rises: list[int],
+    end: int,
+) -> list[tuple[int, int, int, int]]:
+    """Match each completed lead pulse with the first follower pulse inside its window.
+
+    Arguments are entry indices of edges, with NO_RISE marking a fall that never
+    returns. A window opens when the lead pin returns to 1 and closes at the next
+    lead fall (or ``end``). Returns (lead_fall, lead_rise, follow_fall, follow_rise)
+    per completed lead pulse, with NO_RISE follower slots when nothing matched.
+    """
+    matches = []
+    follow_count = len(follow_falls)
+    j = 0
+    for k, (lead_fall, lead_rise) in enumerate(zip(lead_falls, lead_rises)):
+        if lead_rise == NO_RISE:
+            continue
+        window_end = lead_falls[k + 1] if k + 1 < len(lead_falls) else end
+        # Lead rises only move forward, so the follower cursor never goes back
+        while j < follow_count and follow_falls[j] < lead_rise:
+            j += 1
+        if j < follow_count and follow_falls[j] < window_end and follow_rises[j] != NO_RISE:
+            matches.append((lead_fall, lead_rise, follow_falls[j], follow_rises[j]))
+        else:
+            matches.append((lead_fall, lead_rise, NO_RISE, NO_RISE))
+    return matches
+
+
+def _seconds(value_ms: int) -> str:
+    return f"{value_ms / 1000:.3f}s"
+
+
+# Transition validators record issues as compact (type, line_numbers, value_ms) tuples;
+# these templates expand them into the full description/details form on demand.
+_ISSUE_TEMPLATES = {
+    "gpio4_timing_violation": (
+        "GPIO4 timing violation: should be 0 for 1-2 seconds",
+        lambda _lines, ms: {
+            "pattern": "1->0->1",
+            "time_at_0": _seconds(ms),
+            "expected_range": "1.0-2.0 seconds",
+            "valid_timing": False,
+        },
+    ),
+    "gpio4_stuck_at_0": (
+        "GPIO4 stuck at 0 for too long",
+        lambda _lines, ms: {"duration": _seconds(ms), "expected_max": "2.0 seconds"},
+    ),
+    "gpio3_delay_violation": (
+        "GPIO3 delay violation: should go 0 approximately 2s after GPIO4 returns to 1",
+        lambda _lines, ms: {
+            "actual_delay": _seconds(ms),
+            "expected_delay": "~2.0 seconds (1-4s tolerance)",
+            "valid_timing": False,
+        },
+    ),
+    "gpio3_timing_violation": (
+        "GPIO3 timing violation: should be 0 for 15-20 seconds",
+        lambda _lines, ms: {
+            "time_at_0": _seconds(ms),
+            "expected_range": "15.0-20.0 seconds",
+            "valid_timing": False,
+        },
+    ),
+    "missing_gpio3_transition": (
+        "Missing GPIO3 transition: GPIO4 returned to 1 but GPIO3 didn't follow expected pattern",
+        lambda lines, _ms: {
+            "gpio4_return_line": lines[0],
+            "expected": "GPIO3 should go 1->0->1 after GPIO4 returns to 1",
+        },
+    ),
+    "gpio10_no_return": (
+        "GPIO10 went to 0 but never returned to 1",
+        lambda lines, _ms: {
+            "transition_line": lines[0],
+            "expected": "GPIO10 should return to 1 within 4 seconds maximum",
+        },
+    ),
+    "gpio10_timing_violation": (
+        "GPIO10 timing violation: took too long to return to 1",
+        lambda _lines, ms: {
+            "time_at_0": _seconds(ms),
+            "expected_max": "4.0 seconds",
+            "valid_timing": False,
+        },
+    ),
+    "gpio10_stuck_at_0": (
+        "GPIO10 stuck at 0 for too long",
+        lambda _lines, ms: {"duration": _seconds(ms), "expected_max": "4.0 seconds"},
+    ),
+    "gpio2_no_return": (
+        "GPIO2 went to 0 but never returned to 1",
+        lambda lines, _ms: {
+            "transition_line": lines[0],
+            "expected": "GPIO2 should return to 1 within 25 seconds",
+        },
+    ),
+    "gpio2_timing_violation": (
+        "GPIO2 timing violation: took too long to return to 1",
+        lambda _lines, ms: {
+            "time_at_0": _seconds(ms),
+            "expected_max": "25.0 seconds",
+            "valid_timing": False,
+        },
+    ),
+    "gpio2_stuck_at_0": (
+        "GPIO2 stuck at 0 for too long",
+        lambda _lines, ms: {"duration": _seconds(ms), "expected_max": "25.0 seconds"},
+    ),
+}
+
+
+def _expand_issue(issue) -> dict:
+    """Return the dict form of a recorded issue, expanding compact tuples."""
+    if isinstance(issue, dict):
+        return issue
+    issue_type, line_numbers, value_ms = issue
+    description, build_details = _ISSUE_TEMPLATES[issue_type]
+    return {
+        "type": issue_type,
+        "line_numbers": line_numbers,
+        "description": description,
+        "details": build_details(line_numbers, value_ms),
+    }
+
 
 class GPIOLogEntry:
     """Represents a single GPIO log entry."""
 
-    def __init__(self, line_number: int, timestamp_str: str, gpio_states: dict[str, int]):
+    # Entries are built on demand as views; slots keep each one small and cheap to create
+    __slots__ = ("line_number", "timestamp_str", "gpio_states", "timestamp")
+
+    def __init__(
+        self,
+        line_number: int,
+        timestamp_str: str,
+        gpio_states: dict[int, int],
+        detected_fmt: Optional[str] = None,
+    ):
         """Initialise the GPIOLogEntry instance."""
         self.line_number = line_number
         self.timestamp_str = timestamp_str
         self.gpio_states = gpio_states
-        self.timestamp = None
-
-        # Try to parse timestamp
-        try:
-            # Common timestamp formats (prioritizing the new millisecond format from gpio_monitor.py)
-            timestamp_formats = [
-                "%Y-%m-%d %H:%M:%S.%f",  # New format with microseconds/milliseconds (YYYY-MM-DD HH:MM:SS.fff)
-                "%Y-%m-%d %H:%M:%S",  # Standard format without milliseconds
-                "%H:%M:%S.%f",  # Time only with microseconds/milliseconds
-                "%H:%M:%S",  # Time only without milliseconds
-                "%Y/%m/%d %H:%M:%S.%f",  # Alternative date separator with milliseconds
-                "%Y/%m/%d %H:%M:%S",  # Alternative date separator
-                "%d/%m/%Y %H:%M:%S.%f",  # European date format with milliseconds
-                "%d/%m/%Y %H:%M:%S",  # European date format
-            ]
-
-            for fmt in timestamp_formats:
-                try:
-                    self.timestamp = datetime.strptime(timestamp_str.strip(), fmt)
-                    # Log successful parsing for millisecond formats (debug level)
-                    if ".%f" in fmt:
-                        logger.debug(
-                            f"Successfully parsed timestamp with precision: {timestamp_str.strip()}"
-                        )
-                    break
-                except ValueError:
-                    continue
-
-        except Exception as e:
-            logger.warning(
-                f"Could not parse timestamp '{timestamp_str}' on line {line_number}: {e}"
-            )
+        self.timestamp, _ = _parse_ts(timestamp_str.strip(), detected_fmt)
 
     def __str__(self):
         gpio_str = " | ".join(
@@ -82,14 +443,70 @@ class GPIOLogEntry:
 class GPIOLogAnalyzer:
     """Analyzes GPIO log files for consistency."""
 
-    def __init__(self):
-        self.log_entries: list[GPIOLogEntry] = []
+    def __init__(self, edges_only: bool = False):
+        """Initialise the analyzer.
+
+        With ``edges_only``, repeated samples are not stored. Only the samples
+        around a state or pin change, and pairs of samples more than
+        EDGE_KEEP_GAP_MS apart, are kept. The built-in checks give the same
+        results; custom validation rules only see the stored entries.
+        """
+        self.edges_only = edges_only
+        self.sample_count = 0
+        # Edges-only bookkeeping: the latest sample, the latest repeat held back
+        # in case a change follows it, and stored entries followed by dropped samples
+        self._last_sample = None
+        self._held = None
+        self._dropped_after: set[int] = set()
+        # Parsed entries are kept as parallel columns indexed by entry position;
+        # GPIOLogEntry objects are only built on demand as views over them
+        self.line_numbers = array(LINE_NUMBER_TYPECODE)
+        self.timestamp_strs: list[str] = []
+        self.timestamps_ms = array("q")
+        self.pin_columns: dict[int, array] = {}
+        # Bitmask of the pins present in each entry; bits are handed out to pins in
+        # order of first appearance (a Raspberry Pi has far fewer than 64 GPIOs)
+        self.pin_masks = array("Q")
+        self._pin_bits: dict[int, int] = {}
+        # Columns are over-allocated while parsing; only the first _size slots are valid
+        self._size = 0
+        self._capacity = 0
+        # Timestamp format that last matched in the file being parsed
+        self._detected_fmt: Optional[str] = None
         self.header_line = None
         self.footer_line = None
-        self.inconsistencies = []
+        # Issues as recorded: compact tuples from the transition validators, dicts otherwise
+        self._issues: list = []
+        self._expanded_issues: list[dict] = []
         self.gpio_pins = set()
         self.validation_rules = []
 
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> GPIOLogEntry:
+        """Build a GPIOLogEntry view of the entry stored at ``index``."""
+        gpio_states = {
+            pin: column[index]
+            for pin, column in self.pin_columns.items()
+            if column[index] != MISSING_STATE
+        }
+        return GPIOLogEntry(
+            self.line_numbers[index], self.timestamp_strs[index], gpio_states, self._detected_fmt
+        )
+
+    @property
+    def inconsistencies(self) -> list[dict]:
+        """All issues found so far, expanded to their description/details form."""
+        if len(self._expanded_issues) != len(self._issues):
+            self._expanded_issues = [_expand_issue(issue) for issue in self._issues]
+        return self._expanded_issues
+
+    @property
+    def log_entries(self) -> list[GPIOLogEntry]:
+        """All parsed entries as GPIOLogEntry objects (compatibility view)."""
+        return [self[i] for i in range(len(self))]
+
     def add_validation_rule(self, rule_func, description: str):
         """Add a validation rule function."""
         self.validation_rules.append({"function": rule_func, "description": description})
@@ -98,22 +515,131 @@ class GPIOLogAnalyzer:
         """Parse the GPIO log file."""
         logger.info(f"📁 Parsing log file: {filename}")
 
+        # Map the file and scan it with one multi-line regex instead of splitting it
+        # into line objects; the first line is the header and the last one the footer.
+        data_line_count = 0
+        self._detected_fmt = None
         try:
-            with open(filename) as file:
-                lines = file.readlines()
+            with open(filename, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    logger.error("❌ Log file is empty")
+                    return False
+                self._reserve(size // AVG_LINE_BYTES)
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    if hasattr(mmap, "MADV_WILLNEED"):
+                        # The log is read front to back once; have the kernel queue the
+                        # reads up front instead of faulting pages in as the parser goes
+                        buf.madvise(mmap.MADV_SEQUENTIAL)
+                        buf.madvise(mmap.MADV_WILLNEED)
+                    data_line_count = self._parse_buffer(buf, size)
+                self._flush_held()
         except FileNotFoundError:
             logger.error(f"❌ File not found: {filename}")
             return False
         except Exception as e:
             logger.error(f"❌ Error reading file {filename}: {e}")
             return False
+        finally:
+            self._trim()
+
+        logger.info(f"📊 Processed {data_line_count} data lines")
+        logger.info(f"✅ Parsed {self.sample_count} GPIO log entries")
+        if self.edges_only:
+            logger.info(f"📉 Stored {len(self)} entries around GPIO changes")
+        logger.info(f"📌 Detected GPIO pins: {sorted(self.gpio_pins)}")
 
-        if not lines:
-            logger.error("❌ Log file is empty")
+        return len(self) > 0
+
+    def _parse_buffer(self, buf, size: int) -> int:
+        """Parse the header, data lines and footer of a mapped log; return the data line count."""
+        header_end = buf.find(b"\n")
+        if header_end == -1:
+            header_end = size
+        self._parse_header(buf[:header_end])
+
+        # The footer is the last line, ignoring the newline that terminates the file
+        last_newline = size - 1 if buf[size - 1 : size] == b"\n" else size
+        footer_start = buf.rfind(b"\n", 0, last_newline) + 1
+        if footer_start <= header_end:
+            return 0
+
+        data_line_count = 0
+        body_end = footer_start - 1  # Excludes the newline ending the last data line
+        if body_end > header_end and self._ingest_uniform(buf[header_end + 1 : body_end]):
+            data_line_count = self._size
+        elif body_end > header_end:
+            line_num = 1
+            for match in _DATA_LINE_RE.finditer(buf, header_end + 1, body_end):
+                line_num += 1
+                data_line_count += 1
+                timestamp_raw, rest, other = match.groups()
+                if other is not None:
+                    self._parse_data_line(line_num, other)
+                    continue
+                parsed = self._parse_gpio_fields(line_num, timestamp_raw, rest)
+                if parsed is not None:
+                    self._add_sample(line_num, *parsed)
+
+        self._parse_footer(buf[footer_start:])
+        return data_line_count
+
+    def _ingest_uniform(self, body: bytes) -> bool:
+        """Bulk-load data lines that all share the first data line's layout.
+
+        One findall over the whole body extracts every field in C and the state
+        columns are built from the joined digits. Returns False, leaving the
+        analyzer untouched, as soon as any line deviates from the layout; the
+        per-line scan then handles the log and reports what is wrong with it.
+        """
+        if self.edges_only or self._size:
+            return False
+        first_line = body.partition(b"\n")[0]
+        pins = [pin for pin, _ in _GPIO_TOKEN_RE.findall(first_line.partition(b"|")[2])]
+        if not pins or len(set(map(int, pins))) != len(pins):
+            return False
+        layout = b"".join(rb" \| GPIO" + pin + rb"=([01])" for pin in pins)
+        rows = re.compile(rb"^(\S[^|\n]*\S)" + layout + rb"$", re.MULTILINE).findall(body)
+        count = len(rows)
+        if count != body.count(b"\n") + 1:
             return False
 
-        # Parse header (first line)
-        first_line = lines[0].strip()
+        timestamp_col, *state_cols = zip(*rows)
+        timestamp_blob = b"\n".join(timestamp_col)
+        timestamp_strs = timestamp_blob.decode("utf-8", "replace").split("\n")
+        timestamps_ms = None
+        if _ISO_MS_COLUMN_RE.fullmatch(timestamp_blob):
+            timestamps_ms = _iso_ms_column(timestamp_strs)
+        if timestamps_ms is not None:
+            # The first timestamp still goes through format detection
+            self._detected_fmt = _parse_ts(timestamp_strs[0], self._detected_fmt)[1]
+        else:
+            timestamps_ms = array("q")
+            for timestamp_str in timestamp_strs:
+                timestamp, fmt = _parse_ts(timestamp_str, self._detected_fmt)
+                if fmt is not None:
+                    self._detected_fmt = fmt
+                timestamps_ms.append(_to_epoch_ms(timestamp))
+
+        # Data lines are consecutive, right after the header on line 1
+        self.line_numbers = array(LINE_NUMBER_TYPECODE, range(2, count + 2))
+        self.timestamp_strs = timestamp_strs
+        self.timestamps_ms = timestamps_ms
+        mask = 0
+        for pin_text, states in zip(pins, state_cols):
+            pin = int(pin_text)
+            bit = self._pin_bits[pin] = 1 << len(self._pin_bits)
+            mask |= bit
+            self.pin_columns[pin] = array("b", b"".join(states).translate(_DIGIT_TO_STATE))
+            self.gpio_pins.add(pin)
+        self.pin_masks = array("Q", [mask]) * count
+        self._size = self._capacity = count
+        self.sample_count += count
+        return True
+
+    def _parse_header(self, raw: bytes):
+        """Record the first line of the log as its header."""
+        first_line = raw.strip().decode("utf-8", "replace")
         if "=====" in first_line and "STARTING" in first_line.upper():
             self.header_line = first_line
             logger.info(f"✅ Found header: {first_line}")
@@ -121,45 +647,118 @@ class GPIOLogAnalyzer:
             logger.warning(f"⚠️  First line doesn't match expected header format: {first_line}")
             self.header_line = first_line
 
-        # Parse footer (last line)
-        if len(lines) > 1:
-            last_line = lines[-1].strip()
-            if "=====" in last_line and (
-                "STOPPED" in last_line.upper() or "ENDING" in last_line.upper()
+    def _parse_footer(self, raw: bytes):
+        """Record the last line of the log as its footer."""
+        last_line = raw.strip().decode("utf-8", "replace")
+        if "=====" in last_line and (
+            "STOPPED" in last_line.upper() or "ENDING" in last_line.upper()
+        ):
+            self.footer_line = last_line
+            logger.info(f"✅ Found footer: {last_line}")
+        else:
+            logger.warning(f"⚠️  Last line doesn't match expected footer format: {last_line}")
+            self.footer_line = last_line
+
+    def _parse_data_line(self, line_number: int, raw: bytes):
+        """Parse a data line and store the resulting entry, if any."""
+        line = raw.strip()
+        if not line:
+            return
+
+        parsed = self._parse_log_line(line_number, line)
+        if parsed is not None:
+            self._add_sample(line_number, *parsed)
+
+    def _add_sample(self, line_number: int, timestamp_str: str, gpio_states: dict[int, int]):
+        """Store a parsed sample, holding back repeats when parsing edges only."""
+        self.sample_count += 1
+        timestamp, fmt = _parse_ts(timestamp_str, self._detected_fmt)
+        if fmt is not None:
+            self._detected_fmt = fmt
+        timestamp_ms = _to_epoch_ms(timestamp)
+
+        if self.edges_only:
+            previous = self._last_sample
+            self._last_sample = (line_number, timestamp_str, timestamp_ms, gpio_states)
+            if (
+                previous is not None
+                and gpio_states == previous[3]
+                and NO_TIMESTAMP not in (timestamp_ms, previous[2])
+                and timestamp_ms - previous[2] <= EDGE_KEEP_GAP_MS
             ):
-                self.footer_line = last_line
-                logger.info(f"✅ Found footer: {last_line}")
-            else:
-                logger.warning(f"⚠️  Last line doesn't match expected footer format: {last_line}")
-                self.footer_line = last_line
-
-        # Parse data lines (everything between header and footer)
-        data_lines = lines[1:-1] if len(lines) > 2 else []
-
-        logger.info(f"📊 Processing {len(data_lines)} data lines...")
-
-        for line_num, line in enumerate(data_lines, start=2):  # Start from line 2
-            line = line.strip()
-            if not line:
-                continue
-
-            entry = self._parse_log_line(line_num, line)
-            if entry:
-                self.log_entries.append(entry)
-                self.gpio_pins.update(entry.gpio_states.keys())
-
-        logger.info(f"✅ Parsed {len(self.log_entries)} GPIO log entries")
-        logger.info(f"📌 Detected GPIO pins: {sorted(self.gpio_pins)}")
-
-        return len(self.log_entries) > 0
+                # A repeat shortly after the previous sample; keep only the latest one
+                # in case the next sample changes something
+                if self._held is not None:
+                    self._dropped_after.add(self._size - 1)
+                self._held = self._last_sample
+                return
+            self._flush_held()
+
+        self._store_entry(line_number, timestamp_str, timestamp_ms, gpio_states)
+
+    def _flush_held(self):
+        """Store the repeat held back by edges-only parsing, if any."""
+        if self._held is not None:
+            self._store_entry(*self._held)
+            self._held = None
+
+    def _store_entry(
+        self, line_number: int, timestamp_str: str, timestamp_ms: int, gpio_states: dict[int, int]
+    ):
+        """Append a parsed entry to the columns."""
+        index = self._size
+        if index == self._capacity:
+            self._reserve(self._capacity)
+        self.line_numbers[index] = line_number
+        self.timestamp_strs[index] = timestamp_str
+        self.timestamps_ms[index] = timestamp_ms
+
+        mask = 0
+        for pin in gpio_states:
+            bit = self._pin_bits.get(pin)
+            if bit is None:
+                # First time this pin is seen: earlier entries stay marked as missing
+                bit = self._pin_bits[pin] = 1 << len(self._pin_bits)
+                self.pin_columns[pin] = array("b", [MISSING_STATE]) * self._capacity
+                self.gpio_pins.add(pin)
+            mask |= bit
+        self.pin_masks[index] = mask
+        for pin, column in self.pin_columns.items():
+            column[index] = gpio_states.get(pin, MISSING_STATE)
+        self._size = index + 1
+
+    def _reserve(self, extra: int):
+        """Grow every column by at least ``extra`` unused slots."""
+        extra = max(extra, MIN_RESERVED_ENTRIES)
+        self.line_numbers.extend(array(LINE_NUMBER_TYPECODE, [0]) * extra)
+        self.timestamp_strs.extend([""] * extra)
+        self.timestamps_ms.extend(array("q", [NO_TIMESTAMP]) * extra)
+        self.pin_masks.extend(array("Q", [0]) * extra)
+        for column in self.pin_columns.values():
+            column.extend(array("b", [MISSING_STATE]) * extra)
+        self._capacity += extra
+
+    def _trim(self):
+        """Drop the unused slots left over from _reserve()."""
+        del self.line_numbers[self._size :]
+        del self.timestamp_strs[self._size :]
+        del self.timestamps_ms[self._size :]
+        del self.pin_masks[self._size :]
+        for column in self.pin_columns.values():
+            del column[self._size :]
+        self._capacity = self._size
+
+    def _pins_in_mask(self, mask: int) -> set[int]:
+        """Return the pins whose bits are set in a pin_masks value."""
+        return {pin for pin, bit in self._pin_bits.items() if mask & bit}
 
     def validate_initial_state(self) -> bool:
         """Validate that all GPIO values are 1 in the initial state."""
-        if not self.log_entries:
+        if not len(self):
             logger.warning("⚠️  No log entries to validate initial state")
             return True
 
-        first_entry = self.log_entries[0]
+        first_entry = self[0]
         logger.info(f"🔍 Validating initial state (line {first_entry.line_number})...")
 
         invalid_pins = []
@@ -178,7 +777,7 @@ class GPIOLogAnalyzer:
                     "actual": dict(first_entry.gpio_states),
                 },
             }
-            self.inconsistencies.append(issue)
+            self._issues.append(issue)
             logger.error(f"❌ Initial state violation on line {first_entry.line_number}")
             logger.error(f"    Invalid pins: {', '.join(invalid_pins)}")
             return False
@@ -187,94 +786,57 @@ class GPIOLogAnalyzer:
 
     def validate_gpio4_transitions(self) -> bool:
         """Validate GPIO4 transitions: should go 1->0->1 with 1-2 second timing."""
-        if len(self.log_entries) < 3:
+        if self.sample_count < 3:
             logger.warning("⚠️  Need at least 3 entries to validate GPIO4 transitions")
             return True
 
         logger.info("🔍 Validating GPIO4 transition patterns...")
 
-        gpio4_transitions = []
         transition_issues = []
 
         # Find all GPIO4 state changes
-        for i, entry in enumerate(self.log_entries):
-            if "4" in entry.gpio_states:
-                gpio4_state = entry.gpio_states["4"]
-                gpio4_transitions.append(
-                    (i, entry.line_number, gpio4_state, entry.timestamp, entry.timestamp_str)
-                )
+        column = self.pin_columns.get(4)
 
-        if not gpio4_transitions:
+        if column is None:
             logger.warning("⚠️  No GPIO4 states found in log entries")
             return True
 
-        # Analyze transition patterns
-        for i in range(len(gpio4_transitions) - 2):
-            curr_idx, curr_line, curr_state, curr_time, curr_time_str = gpio4_transitions[i]
-            next_idx, next_line, next_state, next_time, next_time_str = gpio4_transitions[i + 1]
-            third_idx, third_line, third_state, third_time, third_time_str = gpio4_transitions[
-                i + 2
-            ]
-
-            # Check for 1->0->1 pattern
-            if curr_state == 1 and next_state == 0 and third_state == 1:
-                # Check timing if timestamps are available
-                if curr_time and next_time and third_time:
-                    time_to_0 = (next_time - curr_time).total_seconds()
-                    time_to_1 = (third_time - next_time).total_seconds()
-                    total_time = (third_time - curr_time).total_seconds()
-
-                    logger.info(
-                        f"✅ Found GPIO4 transition 1->0->1 (lines {curr_line}->{next_line}->{third_line})"
-                    )
-                    logger.info(
-                        f"    Timing: {time_to_0:.3f}s to 0, {time_to_1:.3f}s back to 1, total: {total_time:.3f}s"
-                    )
-
-                    # Validate timing: GPIO4 should be 0 for 1-2 seconds
-                    if time_to_1 < 1.0 or time_to_1 > 2.0:
-                        issue = {
-                            "type": "gpio4_timing_violation",
-                            "line_numbers": (curr_line, next_line, third_line),
-                            "description": "GPIO4 timing violation: should be 0 for 1-2 seconds",
-                            "details": {
-                                "pattern": "1->0->1",
-                                "time_at_0": f"{time_to_1:.3f}s",
-                                "expected_range": "1.0-2.0 seconds",
-                                "valid_timing": False,
-                            },
-                        }
-                        transition_issues.append(issue)
-                        logger.warning(
-                            f"⚠️  GPIO4 timing violation (lines {curr_line}->{next_line}->{third_line}): {time_to_1:.3f}s at 0"
-                        )
-                else:
-                    logger.info(
-                        f"✅ Found GPIO4 transition 1->0->1 (lines {curr_line}->{next_line}->{third_line}) - timing not validated (no timestamps)"
-                    )
+        lines = self.line_numbers
+        timestamps_ms = self.timestamps_ms
+        edges = _column_edges(column)
+
+        pulses = [pair for pair in _fall_rise_pairs(edges) if pair[2] != NO_RISE]
+        if logger.isEnabledFor(logging.DEBUG):
+            for before_fall, fall, rise in pulses:
+                self._debug_gpio4_pulse(before_fall, fall, rise)
+
+        # Validate timing: GPIO4 should be 0 for 1-2 seconds (the sample before the
+        # fall needs a timestamp as well)
+        timed = [pulse for pulse in pulses if timestamps_ms[pulse[0]] != NO_TIMESTAMP]
+        for before_fall, fall, rise, time_to_1 in _timing_violations(
+            timed, timestamps_ms, 1000, 2000
+        ):
+            curr_line, next_line, third_line = lines[before_fall], lines[fall], lines[rise]
+            transition_issues.append(
+                ("gpio4_timing_violation", (curr_line, next_line, third_line), time_to_1)
+            )
+            logger.warning(
+                f"⚠️  GPIO4 timing violation (lines {curr_line}->{next_line}->{third_line}): {time_to_1 / 1000:.3f}s at 0"
+            )
 
-            # Check for invalid patterns
-            elif curr_state == 0 and next_state == 0:
-                # GPIO4 staying at 0 for too long might be an issue
-                if curr_time and next_time:
-                    time_diff = (next_time - curr_time).total_seconds()
-                    if time_diff > 2.0:
-                        issue = {
-                            "type": "gpio4_stuck_at_0",
-                            "line_numbers": (curr_line, next_line),
-                            "description": "GPIO4 stuck at 0 for too long",
-                            "details": {
-                                "duration": f"{time_diff:.3f}s",
-                                "expected_max": "2.0 seconds",
-                            },
-                        }
-                        transition_issues.append(issue)
-                        logger.warning(
-                            f"⚠️  GPIO4 stuck at 0 for {time_diff:.3f}s (lines {curr_line}->{next_line})"
-                        )
+        # GPIO4 staying at 0 for too long between consecutive samples might be an issue
+        for index, next_index, time_diff in _stuck_at_zero(
+            column, timestamps_ms, edges, 2000, self._dropped_after
+        ):
+            curr_line, next_line = lines[index], lines[next_index]
+            transition_issues.append(("gpio4_stuck_at_0", (curr_line, next_line), time_diff))
+            logger.warning(
+                f"⚠️  GPIO4 stuck at 0 for {time_diff / 1000:.3f}s (lines {curr_line}->{next_line})"
+            )
 
-        # Add all issues to the main inconsistencies list
-        self.inconsistencies.extend(transition_issues)
+        # Add all issues to the main inconsistencies list, in log order
+        transition_issues.sort(key=lambda issue: issue[1][0])
+        self._issues.extend(transition_issues)
 
         if not transition_issues:
             logger.info("✅ All GPIO4 transitions are valid")
@@ -282,9 +844,66 @@ class GPIOLogAnalyzer:
         logger.warning(f"⚠️  Found {len(transition_issues)} GPIO4 transition issues")
         return False
 
+    def _debug_gpio4_pulse(self, before_fall: int, fall: int, rise: int):
+        """Log the lines and timing of a GPIO4 1->0->1 pulse at DEBUG level."""
+        lines = self.line_numbers
+        curr_time, next_time, third_time = (
+            self.timestamps_ms[i] for i in (before_fall, fall, rise)
+        )
+        if NO_TIMESTAMP in (curr_time, next_time, third_time):
+            logger.debug(
+                "✅ Found GPIO4 transition 1->0->1 (lines %s->%s->%s) "
+                "- timing not validated (no timestamps)",
+                lines[before_fall],
+                lines[fall],
+                lines[rise],
+            )
+            return
+        logger.debug(
+            "✅ Found GPIO4 transition 1->0->1 (lines %s->%s->%s)",
+            lines[before_fall],
+            lines[fall],
+            lines[rise],
+        )
+        logger.debug(
+            "    Timing: %.3fs to 0, %.3fs back to 1, total: %.3fs",
+            (next_time - curr_time) / 1000,
+            (third_time - next_time) / 1000,
+            (third_time - curr_time) / 1000,
+        )
+
+    def _debug_returns(self, pin: int, pairs: list[tuple[int, int, int]], max_s: float):
+        """Log each 1->0 edge of ``pin`` and its return to 1 at DEBUG level."""
+        lines = self.line_numbers
+        timestamps_ms = self.timestamps_ms
+        for before_fall, fall, rise in pairs:
+            logger.debug(
+                "📍 Found GPIO%s transition 1->0 at lines %s->%s",
+                pin,
+                lines[before_fall],
+                lines[fall],
+            )
+            if rise == NO_RISE:
+                continue
+            logger.debug("✅ Found GPIO%s return to 1 at line %s", pin, lines[rise])
+            if NO_TIMESTAMP in (timestamps_ms[fall], timestamps_ms[rise]):
+                logger.debug(
+                    "✅ Found GPIO%s return to 1 - timing not validated (no timestamps)", pin
+                )
+                continue
+            duration_at_0 = (timestamps_ms[rise] - timestamps_ms[fall]) / 1000
+            logger.debug("    Timing: GPIO%s was at 0 for %.3fs", pin, duration_at_0)
+            if duration_at_0 <= max_s:
+                logger.debug(
+                    "✅ GPIO%s timing valid: %.3fs at 0 (within %.1fs limit)",
+                    pin,
+                    duration_at_0,
+                    max_s,
+                )
+
     def validate_gpio3_transitions(self) -> bool:
         """Validate GPIO3 transitions: should go 1->0->1 with 15-20 second timing, after GPIO4 returns to 1."""
-        if len(self.log_entries) < 5:
+        if self.sample_count < 5:
             logger.warning("⚠️  Need at least 5 entries to validate GPIO3 transitions")
             return True
 
@@ -292,140 +911,96 @@ class GPIOLogAnalyzer:
 
         transition_issues = []
 
-        # Find GPIO4 1->0->1 transitions first, then check for GPIO3 transitions
-        for i in range(len(self.log_entries) - 4):
-            # Look for GPIO4 pattern: 1->0->1
-            entries = self.log_entries[i : i + 5]  # Look at 5 consecutive entries
+        lines = self.line_numbers
+        timestamps_ms = self.timestamps_ms
+
+        # Edges are located once per pin, then GPIO3 pulses are matched to GPIO4 pulses
+        pulses = []
+        if 3 in self.pin_columns and 4 in self.pin_columns:
+            # Logs without GPIO3 at all are not checked against GPIO4 pulses
+            pin_edges = []
+            for pin in (4, 3):
+                pairs = _fall_rise_pairs(_column_edges(self.pin_columns[pin]))
+                pin_edges.append([fall for _, fall, _ in pairs])
+                pin_edges.append([rise for _, _, rise in pairs])
+            pulses = _match_followers(*pin_edges, len(self))
+
+        # Walk GPIO4 1->0->1 pulses with the GPIO3 pulse that followed each one
+        for gpio4_fall, gpio4_return, gpio3_goes_0, gpio3_returns_1 in pulses:
+            logger.debug(
+                "📍 Found GPIO4 transition 1->0->1 at lines %s-%s",
+                lines[gpio4_fall],
+                lines[gpio4_return],
+            )
 
-            if (
-                len(entries) >= 3
-                and "4" in entries[0].gpio_states
-                and "4" in entries[1].gpio_states
-                and "4" in entries[2].gpio_states
-                and "3" in entries[0].gpio_states
-                and "3" in entries[1].gpio_states
-                and "3" in entries[2].gpio_states
-            ):
-                gpio4_states = [entries[j].gpio_states["4"] for j in range(3)]
-                gpio3_states = [entries[j].gpio_states["3"] for j in range(min(5, len(entries)))]
+            # Validate GPIO3 transition if found
+            if gpio3_goes_0 != NO_RISE:
+                logger.debug(
+                    "✅ Found GPIO3 transition 1->0->1 (lines %s->%s)",
+                    lines[gpio3_goes_0],
+                    lines[gpio3_returns_1],
+                )
 
-                # Check if we have GPIO4 pattern 1->0->1
-                if gpio4_states == [1, 0, 1]:
-                    logger.info(
-                        f"📍 Found GPIO4 transition 1->0->1 at lines {entries[0].line_number}-{entries[2].line_number}"
+                # Check timing if timestamps are available
+                gpio3_times = (
+                    timestamps_ms[gpio4_return],
+                    timestamps_ms[gpio3_goes_0],
+                    timestamps_ms[gpio3_returns_1],
+                )
+                if NO_TIMESTAMP not in gpio3_times:
+                    # Time from GPIO4 return to GPIO3 going 0 (should be ~2 seconds)
+                    delay_to_gpio3_0 = gpio3_times[1] - gpio3_times[0]
+
+                    # Time GPIO3 stays at 0 (should be 15-20 seconds)
+                    gpio3_duration_at_0 = gpio3_times[2] - gpio3_times[1]
+                    logger.debug(
+                        "    Timing: %.3fs delay after GPIO4, %.3fs at 0",
+                        delay_to_gpio3_0 / 1000,
+                        gpio3_duration_at_0 / 1000,
                     )
 
-                    # Now look for GPIO3 transition after GPIO4 returns to 1
-                    # GPIO3 should go 0 approximately 2 seconds after GPIO4 returns to 1
-                    gpio4_return_entry = entries[2]  # When GPIO4 returns to 1
-
-                    # Look for GPIO3 going to 0 in subsequent entries
-                    gpio3_goes_0_entry = None
-                    gpio3_returns_1_entry = None
-
-                    for j in range(2, min(len(entries), len(self.log_entries) - i)):
-                        if j < len(entries) and "3" in entries[j].gpio_states:
-                            if entries[j].gpio_states["3"] == 0 and gpio3_goes_0_entry is None:
-                                gpio3_goes_0_entry = entries[j]
-                            elif (
-                                entries[j].gpio_states["3"] == 1
-                                and gpio3_goes_0_entry is not None
-                                and gpio3_returns_1_entry is None
-                            ):
-                                gpio3_returns_1_entry = entries[j]
-                                break
-
-                    # Validate GPIO3 transition if found
-                    if gpio3_goes_0_entry and gpio3_returns_1_entry:
-                        logger.info(
-                            f"✅ Found GPIO3 transition 1->0->1 (lines {gpio3_goes_0_entry.line_number}->{gpio3_returns_1_entry.line_number})"
-                        )
-
-                        # Check timing if timestamps are available
-                        if (
-                            gpio4_return_entry.timestamp
-                            and gpio3_goes_0_entry.timestamp
-                            and gpio3_returns_1_entry.timestamp
-                        ):
-                            # Time from GPIO4 return to GPIO3 going 0 (should be ~2 seconds)
-                            delay_to_gpio3_0 = (
-                                gpio3_goes_0_entry.timestamp - gpio4_return_entry.timestamp
-                            ).total_seconds()
-
-                            # Time GPIO3 stays at 0 (should be 15-20 seconds)
-                            gpio3_duration_at_0 = (
-                                gpio3_returns_1_entry.timestamp - gpio3_goes_0_entry.timestamp
-                            ).total_seconds()
-
-                            logger.info(
-                                f"    Timing: {delay_to_gpio3_0:.3f}s delay after GPIO4, {gpio3_duration_at_0:.3f}s at 0"
+                    # Validate delay (should be around 2 seconds, allow some tolerance)
+                    if delay_to_gpio3_0 < 1000 or delay_to_gpio3_0 > 4000:
+                        transition_issues.append(
+                            (
+                                "gpio3_delay_violation",
+                                (lines[gpio4_return], lines[gpio3_goes_0]),
+                                delay_to_gpio3_0,
                             )
+                        )
+                        logger.warning(
+                            f"⚠️  GPIO3 delay violation: {delay_to_gpio3_0 / 1000:.3f}s delay (expected ~2s)"
+                        )
 
-                            # Validate delay (should be around 2 seconds, allow some tolerance)
-                            if delay_to_gpio3_0 < 1.0 or delay_to_gpio3_0 > 4.0:
-                                issue = {
-                                    "type": "gpio3_delay_violation",
-                                    "line_numbers": (
-                                        gpio4_return_entry.line_number,
-                                        gpio3_goes_0_entry.line_number,
-                                    ),
-                                    "description": "GPIO3 delay violation: should go 0 approximately 2s after GPIO4 returns to 1",
-                                    "details": {
-                                        "actual_delay": f"{delay_to_gpio3_0:.3f}s",
-                                        "expected_delay": "~2.0 seconds (1-4s tolerance)",
-                                        "valid_timing": False,
-                                    },
-                                }
-                                transition_issues.append(issue)
-                                logger.warning(
-                                    f"⚠️  GPIO3 delay violation: {delay_to_gpio3_0:.3f}s delay (expected ~2s)"
-                                )
-
-                            # Validate duration at 0 (should be 15-20 seconds)
-                            if gpio3_duration_at_0 < 15.0 or gpio3_duration_at_0 > 20.0:
-                                issue = {
-                                    "type": "gpio3_timing_violation",
-                                    "line_numbers": (
-                                        gpio3_goes_0_entry.line_number,
-                                        gpio3_returns_1_entry.line_number,
-                                    ),
-                                    "description": "GPIO3 timing violation: should be 0 for 15-20 seconds",
-                                    "details": {
-                                        "time_at_0": f"{gpio3_duration_at_0:.3f}s",
-                                        "expected_range": "15.0-20.0 seconds",
-                                        "valid_timing": False,
-                                    },
-                                }
-                                transition_issues.append(issue)
-                                logger.warning(
-                                    f"⚠️  GPIO3 timing violation: {gpio3_duration_at_0:.3f}s at 0 (expected 15-20s)"
-                                )
-                            else:
-                                logger.info(
-                                    f"✅ GPIO3 timing valid: {gpio3_duration_at_0:.3f}s at 0"
-                                )
-                        else:
-                            logger.info(
-                                "✅ Found GPIO3 transition pattern - timing not validated (no timestamps)"
+                    # Validate duration at 0 (should be 15-20 seconds)
+                    if gpio3_duration_at_0 < 15000 or gpio3_duration_at_0 > 20000:
+                        transition_issues.append(
+                            (
+                                "gpio3_timing_violation",
+                                (lines[gpio3_goes_0], lines[gpio3_returns_1]),
+                                gpio3_duration_at_0,
                             )
-                    else:
-                        # GPIO4 returned to 1 but no corresponding GPIO3 transition found
-                        issue = {
-                            "type": "missing_gpio3_transition",
-                            "line_numbers": (gpio4_return_entry.line_number,),
-                            "description": "Missing GPIO3 transition: GPIO4 returned to 1 but GPIO3 didn't follow expected pattern",
-                            "details": {
-                                "gpio4_return_line": gpio4_return_entry.line_number,
-                                "expected": "GPIO3 should go 1->0->1 after GPIO4 returns to 1",
-                            },
-                        }
-                        transition_issues.append(issue)
+                        )
                         logger.warning(
-                            f"⚠️  Missing GPIO3 transition after GPIO4 return at line {gpio4_return_entry.line_number}"
+                            f"⚠️  GPIO3 timing violation: {gpio3_duration_at_0 / 1000:.3f}s at 0 (expected 15-20s)"
+                        )
+                    else:
+                        logger.debug(
+                            "✅ GPIO3 timing valid: %.3fs at 0", gpio3_duration_at_0 / 1000
                         )
+                else:
+                    logger.debug(
+                        "✅ Found GPIO3 transition pattern - timing not validated (no timestamps)"
+                    )
+            else:
+                # GPIO4 returned to 1 but no corresponding GPIO3 transition found
+                transition_issues.append(("missing_gpio3_transition", (lines[gpio4_return],), None))
+                logger.warning(
+                    f"⚠️  Missing GPIO3 transition after GPIO4 return at line {lines[gpio4_return]}"
+                )
 
         # Add all issues to the main inconsistencies list
-        self.inconsistencies.extend(transition_issues)
+        self._issues.extend(transition_issues)
 
         if not transition_issues:
             logger.info("✅ All GPIO3 transitions are valid")
@@ -435,125 +1010,64 @@ class GPIOLogAnalyzer:
 
     def validate_gpio10_transitions(self) -> bool:
         """Validate GPIO10 transitions: should return to 1 within 4 seconds maximum when it goes to 0."""
-        if len(self.log_entries) < 2:
+        if self.sample_count < 2:
             logger.warning("⚠️  Need at least 2 entries to validate GPIO10 transitions")
             return True
 
         logger.info("🔍 Validating GPIO10 transition patterns...")
 
-        gpio10_transitions = []
         transition_issues = []
 
         # Find all GPIO10 state changes
-        for i, entry in enumerate(self.log_entries):
-            if "10" in entry.gpio_states:
-                gpio10_state = entry.gpio_states["10"]
-                gpio10_transitions.append(
-                    (i, entry.line_number, gpio10_state, entry.timestamp, entry.timestamp_str)
-                )
+        column = self.pin_columns.get(10)
 
-        if not gpio10_transitions:
+        if column is None:
             logger.warning("⚠️  No GPIO10 states found in log entries")
             return True
 
-        # Analyze GPIO10 transitions for 1->0->1 patterns
-        for i in range(len(gpio10_transitions) - 1):
-            curr_idx, curr_line, curr_state, curr_time, curr_time_str = gpio10_transitions[i]
-            next_idx, next_line, next_state, next_time, next_time_str = gpio10_transitions[i + 1]
-
-            # Check for transition to 0
-            if curr_state == 1 and next_state == 0:
-                logger.info(f"📍 Found GPIO10 transition 1->0 at lines {curr_line}->{next_line}")
-
-                # Look for return to 1
-                return_to_1_found = False
-                for j in range(i + 2, len(gpio10_transitions)):
-                    ret_idx, ret_line, ret_state, ret_time, ret_time_str = gpio10_transitions[j]
-
-                    if ret_state == 1:
-                        # Found return to 1
-                        return_to_1_found = True
-                        logger.info(f"✅ Found GPIO10 return to 1 at line {ret_line}")
-
-                        # Check timing if timestamps are available
-                        if next_time and ret_time:
-                            duration_at_0 = (ret_time - next_time).total_seconds()
-                            logger.info(f"    Timing: GPIO10 was at 0 for {duration_at_0:.3f}s")
-
-                            # Validate timing: GPIO10 should return to 1 within 4 seconds maximum
-                            if duration_at_0 > 4.0:
-                                issue = {
-                                    "type": "gpio10_timing_violation",
-                                    "line_numbers": (next_line, ret_line),
-                                    "description": "GPIO10 timing violation: took too long to return to 1",
-                                    "details": {
-                                        "time_at_0": f"{duration_at_0:.3f}s",
-                                        "expected_max": "4.0 seconds",
-                                        "valid_timing": False,
-                                    },
-                                }
-                                transition_issues.append(issue)
-                                logger.warning(
-                                    f"⚠️  GPIO10 timing violation: {duration_at_0:.3f}s at 0 (max 4.0s)"
-                                )
-                            else:
-                                logger.info(
-                                    f"✅ GPIO10 timing valid: {duration_at_0:.3f}s at 0 (within 4.0s limit)"
-                                )
-                        else:
-                            logger.info(
-                                "✅ Found GPIO10 return to 1 - timing not validated (no timestamps)"
-                            )
-                        break
-                    if ret_state == 0:
-                        # Still at 0, continue looking
-                        continue
-
-                # If we didn't find a return to 1, that might be an issue
-                if not return_to_1_found:
-                    # Check if this is the last transition or if there are more entries to check
-                    if i + 2 >= len(gpio10_transitions):
-                        logger.warning(
-                            f"⚠️  GPIO10 went to 0 at line {next_line} but no return to 1 found in remaining log"
-                        )
-                        issue = {
-                            "type": "gpio10_no_return",
-                            "line_numbers": (next_line,),
-                            "description": "GPIO10 went to 0 but never returned to 1",
-                            "details": {
-                                "transition_line": next_line,
-                                "expected": "GPIO10 should return to 1 within 4 seconds maximum",
-                            },
-                        }
-                        transition_issues.append(issue)
+        # Pair every GPIO10 1->0 edge with its return to 1
+        lines = self.line_numbers
+        timestamps_ms = self.timestamps_ms
+        edges = _column_edges(column)
+        last_sample = max(column.tobytes().rfind(state) for state in _STATE_BYTES)
+
+        pairs = _fall_rise_pairs(edges)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug_returns(10, pairs, 4.0)
+
+        # Validate timing: GPIO10 should return to 1 within 4 seconds
+        for _, fall, rise, duration_at_0 in _timing_violations(
+            pairs, timestamps_ms, float("-inf"), 4000
+        ):
+            transition_issues.append(
+                ("gpio10_timing_violation", (lines[fall], lines[rise]), duration_at_0)
+            )
+            logger.warning(
+                f"⚠️  GPIO10 timing violation: {duration_at_0 / 1000:.3f}s at 0 (max 4.0s)"
+            )
+
+        # A 1->0 edge without a return is only flagged when it is the very last GPIO10 sample
+        if pairs and pairs[-1][2] == NO_RISE and pairs[-1][1] == last_sample:
+            next_line = lines[pairs[-1][1]]
+            logger.warning(
+                f"⚠️  GPIO10 went to 0 at line {next_line} but no return to 1 found in remaining log"
+            )
+            transition_issues.append(("gpio10_no_return", (next_line,), None))
 
         # Also check for GPIO10 staying at 0 too long between any consecutive 0 states
-        for i in range(len(gpio10_transitions) - 1):
-            curr_idx, curr_line, curr_state, curr_time, curr_time_str = gpio10_transitions[i]
-            next_idx, next_line, next_state, next_time, next_time_str = gpio10_transitions[i + 1]
-
-            # If both states are 0 and we have timestamps, check duration
-            if curr_state == 0 and next_state == 0 and curr_time and next_time:
-                duration_between = (next_time - curr_time).total_seconds()
-
-                # If there's more than 4 seconds between consecutive 0 states, that's a violation
-                if duration_between > 4.0:
-                    issue = {
-                        "type": "gpio10_stuck_at_0",
-                        "line_numbers": (curr_line, next_line),
-                        "description": "GPIO10 stuck at 0 for too long",
-                        "details": {
-                            "duration": f"{duration_between:.3f}s",
-                            "expected_max": "4.0 seconds",
-                        },
-                    }
-                    transition_issues.append(issue)
-                    logger.warning(
-                        f"⚠️  GPIO10 stuck at 0 for {duration_between:.3f}s (lines {curr_line}->{next_line})"
-                    )
+        for index, next_index, duration_between in _stuck_at_zero(
+            column, timestamps_ms, edges, 4000, self._dropped_after
+        ):
+            curr_line, next_line = lines[index], lines[next_index]
+            transition_issues.append(
+                ("gpio10_stuck_at_0", (curr_line, next_line), duration_between)
+            )
+            logger.warning(
+                f"⚠️  GPIO10 stuck at 0 for {duration_between / 1000:.3f}s (lines {curr_line}->{next_line})"
+            )
 
         # Add all issues to the main inconsistencies list
-        self.inconsistencies.extend(transition_issues)
+        self._issues.extend(transition_issues)
 
         if not transition_issues:
             logger.info("✅ All GPIO10 transitions are valid")
@@ -563,124 +1077,62 @@ class GPIOLogAnalyzer:
 
     def validate_gpio2_transitions(self) -> bool:
         """Validate GPIO2 transitions: should return to 1 within 25 seconds maximum when it goes to 0."""
-        if len(self.log_entries) < 2:
+        if self.sample_count < 2:
             logger.warning("⚠️  Need at least 2 entries to validate GPIO2 transitions")
             return True
 
         logger.info("🔍 Validating GPIO2 transition patterns...")
 
-        gpio2_transitions = []
         transition_issues = []
 
         # Find all GPIO2 state changes
-        for i, entry in enumerate(self.log_entries):
-            if "2" in entry.gpio_states:
-                gpio2_state = entry.gpio_states["2"]
-                gpio2_transitions.append(
-                    (i, entry.line_number, gpio2_state, entry.timestamp, entry.timestamp_str)
-                )
+        column = self.pin_columns.get(2)
 
-        if not gpio2_transitions:
+        if column is None:
             logger.warning("⚠️  No GPIO2 states found in log entries")
             return True
 
-        # Analyze GPIO2 transitions for 1->0->1 patterns
-        for i in range(len(gpio2_transitions) - 1):
-            curr_idx, curr_line, curr_state, curr_time, curr_time_str = gpio2_transitions[i]
-            next_idx, next_line, next_state, next_time, next_time_str = gpio2_transitions[i + 1]
-
-            # Check for transition to 0
-            if curr_state == 1 and next_state == 0:
-                logger.info(f"📍 Found GPIO2 transition 1->0 at lines {curr_line}->{next_line}")
-
-                # Look for return to 1
-                return_to_1_found = False
-                for j in range(i + 2, len(gpio2_transitions)):
-                    ret_idx, ret_line, ret_state, ret_time, ret_time_str = gpio2_transitions[j]
-
-                    if ret_state == 1:
-                        # Found return to 1
-                        return_to_1_found = True
-                        logger.info(f"✅ Found GPIO2 return to 1 at line {ret_line}")
-
-                        # Check timing if timestamps are available
-                        if next_time and ret_time:
-                            duration_at_0 = (ret_time - next_time).total_seconds()
-                            logger.info(f"    Timing: GPIO2 was at 0 for {duration_at_0:.3f}s")
-
-                            # Validate timing: GPIO2 should return to 1 within 25 seconds
-                            if duration_at_0 > 25.0:
-                                issue = {
-                                    "type": "gpio2_timing_violation",
-                                    "line_numbers": (next_line, ret_line),
-                                    "description": "GPIO2 timing violation: took too long to return to 1",
-                                    "details": {
-                                        "time_at_0": f"{duration_at_0:.3f}s",
-                                        "expected_max": "25.0 seconds",
-                                        "valid_timing": False,
-                                    },
-                                }
-                                transition_issues.append(issue)
-                                logger.warning(
-                                    f"⚠️  GPIO2 timing violation: {duration_at_0:.3f}s at 0 (max 25.0s)"
-                                )
-                            else:
-                                logger.info(
-                                    f"✅ GPIO2 timing valid: {duration_at_0:.3f}s at 0 (within 25.0s limit)"
-                                )
-                        else:
-                            logger.info(
-                                "✅ Found GPIO2 return to 1 - timing not validated (no timestamps)"
-                            )
-                        break
-                    if ret_state == 0:
-                        # Still at 0, continue looking
-                        continue
-
-                # If we didn't find a return to 1, that might be an issue
-                # Check if this is the last transition or if there are more entries to check
-                if not return_to_1_found and i + 2 >= len(gpio2_transitions):
-                    logger.warning(
-                        f"⚠️  GPIO2 went to 0 at line {next_line} but no return to 1 found in remaining log"
-                    )
-                    issue = {
-                        "type": "gpio2_no_return",
-                        "line_numbers": (next_line,),
-                        "description": "GPIO2 went to 0 but never returned to 1",
-                        "details": {
-                            "transition_line": next_line,
-                            "expected": "GPIO2 should return to 1 within 25 seconds",
-                        },
-                    }
-                    transition_issues.append(issue)
+        # Pair every GPIO2 1->0 edge with its return to 1
+        lines = self.line_numbers
+        timestamps_ms = self.timestamps_ms
+        edges = _column_edges(column)
+        last_sample = max(column.tobytes().rfind(state) for state in _STATE_BYTES)
+
+        pairs = _fall_rise_pairs(edges)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug_returns(2, pairs, 25.0)
+
+        # Validate timing: GPIO2 should return to 1 within 25 seconds
+        for _, fall, rise, duration_at_0 in _timing_violations(
+            pairs, timestamps_ms, float("-inf"), 25000
+        ):
+            transition_issues.append(
+                ("gpio2_timing_violation", (lines[fall], lines[rise]), duration_at_0)
+            )
+            logger.warning(
+                f"⚠️  GPIO2 timing violation: {duration_at_0 / 1000:.3f}s at 0 (max 25.0s)"
+            )
+
+        # A 1->0 edge without a return is only flagged when it is the very last GPIO2 sample
+        if pairs and pairs[-1][2] == NO_RISE and pairs[-1][1] == last_sample:
+            next_line = lines[pairs[-1][1]]
+            logger.warning(
+                f"⚠️  GPIO2 went to 0 at line {next_line} but no return to 1 found in remaining log"
+            )
+            transition_issues.append(("gpio2_no_return", (next_line,), None))
 
         # Also check for GPIO2 staying at 0 too long between any consecutive 0 states
-        for i in range(len(gpio2_transitions) - 1):
-            curr_idx, curr_line, curr_state, curr_time, curr_time_str = gpio2_transitions[i]
-            next_idx, next_line, next_state, next_time, next_time_str = gpio2_transitions[i + 1]
-
-            # If both states are 0 and we have timestamps, check duration
-            if curr_state == 0 and next_state == 0 and curr_time and next_time:
-                duration_between = (next_time - curr_time).total_seconds()
-
-                # If there's more than 25 seconds between consecutive 0 states, that's a violation
-                if duration_between > 25.0:
-                    issue = {
-                        "type": "gpio2_stuck_at_0",
-                        "line_numbers": (curr_line, next_line),
-                        "description": "GPIO2 stuck at 0 for too long",
-                        "details": {
-                            "duration": f"{duration_between:.3f}s",
-                            "expected_max": "25.0 seconds",
-                        },
-                    }
-                    transition_issues.append(issue)
-                    logger.warning(
-                        f"⚠️  GPIO2 stuck at 0 for {duration_between:.3f}s (lines {curr_line}->{next_line})"
-                    )
+        for index, next_index, duration_between in _stuck_at_zero(
+            column, timestamps_ms, edges, 25000, self._dropped_after
+        ):
+            curr_line, next_line = lines[index], lines[next_index]
+            transition_issues.append(("gpio2_stuck_at_0", (curr_line, next_line), duration_between))
+            logger.warning(
+                f"⚠️  GPIO2 stuck at 0 for {duration_between / 1000:.3f}s (lines {curr_line}->{next_line})"
+            )
 
         # Add all issues to the main inconsistencies list
-        self.inconsistencies.extend(transition_issues)
+        self._issues.extend(transition_issues)
 
         if not transition_issues:
             logger.info("✅ All GPIO2 transitions are valid")
@@ -688,41 +1140,47 @@ class GPIOLogAnalyzer:
         logger.warning(f"⚠️  Found {len(transition_issues)} GPIO2 transition issues")
         return False
 
-    def _parse_log_line(self, line_number: int, line: str) -> Optional[GPIOLogEntry]:
-        """Parse a single log line."""
+    def _parse_log_line(
+        self, line_number: int, line: bytes
+    ) -> Optional[tuple[str, dict[int, int]]]:
+        """Parse a single log line into its timestamp string and GPIO states."""
         # Expected format: YYYY-MM-DD HH:MM:SS.fff | GPIO2=1 | GPIO3=1 | GPIO4=1 | GPIO10=1
 
-        if "|" not in line:
-            logger.warning(f"⚠️  Line {line_number}: No '|' separator found")
+        # Cheap substring test first: a line without any GPIO token is never a data line
+        if b"GPIO" not in line:
+            logger.warning(f"⚠️  Line {line_number}: No GPIO states found")
             return None
 
-        parts = line.split("|")
-        if len(parts) < 2:
-            logger.warning(f"⚠️  Line {line_number}: Invalid format - not enough parts")
+        timestamp_raw, sep, rest = line.partition(b"|")
+        if not sep:
+            logger.warning(f"⚠️  Line {line_number}: No '|' separator found")
             return None
 
-        timestamp_str = parts[0].strip()
-        gpio_parts = parts[1:]
+        return self._parse_gpio_fields(line_number, timestamp_raw, rest)
+
+    def _parse_gpio_fields(
+        self, line_number: int, timestamp_raw: bytes, rest: bytes
+    ) -> Optional[tuple[str, dict[int, int]]]:
+        """Parse the fields on either side of a data line's first '|' separator."""
+        timestamp_str = timestamp_raw.strip().decode("utf-8", "replace")
 
         # Parse GPIO states
-        gpio_states = {}
-        gpio_pattern = re.compile(r"GPIO(\d+)=(\d+)")
-
-        for part in gpio_parts:
-            part_ = part.strip()
-            match = gpio_pattern.match(part_)
-            if match:
-                pin = match.group(1)
-                state = int(match.group(2))
-                gpio_states[pin] = state
-            elif part_:  # Only warn if part is not empty
-                logger.warning(f"⚠️  Line {line_number}: Could not parse GPIO part: '{part_}'")
+        tokens = _GPIO_TOKEN_RE.findall(rest)
+        if len(tokens) != rest.count(b"="):
+            # Some part did not match; re-scan part by part only to report it
+            # Plain split + strip: a "\s*\|\s*" regex is quadratic on long whitespace runs
+            for part in map(bytes.strip, rest.split(b"|")):
+                if part and not _GPIO_TOKEN_RE.fullmatch(part):
+                    part_ = part.decode("utf-8", "replace")
+                    logger.warning(f"⚠️  Line {line_number}: Could not parse GPIO part: '{part_}'")
+
+        gpio_states = {int(pin): int(state) for pin, state in tokens}
 
         if not gpio_states:
             logger.warning(f"⚠️  Line {line_number}: No GPIO states found")
             return None
 
-        return GPIOLogEntry(line_number, timestamp_str, gpio_states)
+        return timestamp_str, gpio_states
 
     def check_consistency(self) -> bool:
         """Check consistency between consecutive log entries and validate initial state."""
@@ -743,7 +1201,7 @@ class GPIOLogAnalyzer:
         # Validate GPIO2 transitions
         gpio2_transitions_valid = self.validate_gpio2_transitions()
 
-        if len(self.log_entries) < 2:
+        if self.sample_count < 2:
             logger.warning("⚠️  Need at least 2 entries to check consecutive consistency")
             return (
                 initial_state_valid
@@ -756,52 +1214,65 @@ class GPIOLogAnalyzer:
         logger.info("🔍 Checking consistency between consecutive entries...")
         inconsistency_count = 0
 
-        for i in range(1, len(self.log_entries)):
-            prev_entry = self.log_entries[i - 1]
-            curr_entry = self.log_entries[i]
+        pin_masks = self.pin_masks
+
+        # Custom rules see every consecutive pair; otherwise only the entries where the
+        # pin set changes need a look
+        if self.validation_rules:
+            indices = range(1, len(self))
+        else:
+            indices = _presence_changes(self.pin_columns)
 
-            # Check if all GPIO pins are present in both entries
-            prev_pins = set(prev_entry.gpio_states.keys())
-            curr_pins = set(curr_entry.gpio_states.keys())
+        for i in indices:
+            prev_line = self.line_numbers[i - 1]
+            curr_line = self.line_numbers[i]
 
-            if prev_pins != curr_pins:
+            # Check if all GPIO pins are present in both entries; pin sets are only
+            # decoded from the masks when they differ
+            if pin_masks[i] != pin_masks[i - 1]:
+                prev_pins = self._pins_in_mask(pin_masks[i - 1])
+                curr_pins = self._pins_in_mask(pin_masks[i])
                 missing_in_curr = prev_pins - curr_pins
                 missing_in_prev = curr_pins - prev_pins
 
                 issue = {
                     "type": "missing_gpio_pins",
-                    "line_numbers": (prev_entry.line_number, curr_entry.line_number),
-                    "description": f"GPIO pin mismatch between lines {prev_entry.line_number} and {curr_entry.line_number}",
+                    "line_numbers": (prev_line, curr_line),
+                    "description": f"GPIO pin mismatch between lines {prev_line} and {curr_line}",
                     "details": {
                         "missing_in_current": list(missing_in_curr),
                         "missing_in_previous": list(missing_in_prev),
                     },
                 }
-                self.inconsistencies.append(issue)
+                self._issues.append(issue)
                 inconsistency_count += 1
                 logger.warning(f"⚠️  {issue['description']}")
                 if missing_in_curr:
-                    logger.warning(f"    Missing in current: GPIO{', GPIO'.join(missing_in_curr)}")
+                    logger.warning(
+                        f"    Missing in current: GPIO{', GPIO'.join(map(str, missing_in_curr))}"
+                    )
                 if missing_in_prev:
-                    logger.warning(f"    Missing in previous: GPIO{', GPIO'.join(missing_in_prev)}")
+                    logger.warning(
+                        f"    Missing in previous: GPIO{', GPIO'.join(map(str, missing_in_prev))}"
+                    )
 
-            # Apply custom validation rules
+            # Apply custom validation rules; entry objects are only built when needed
+            if self.validation_rules:
+                prev_entry = self[i - 1]
+                curr_entry = self[i]
             for rule in self.validation_rules:
                 try:
                     rule_result = rule["function"](prev_entry, curr_entry)
                     if not rule_result.get("valid", True):
                         issue = {
                             "type": "rule_violation",
-                            "line_numbers": (prev_entry.line_number, curr_entry.line_number),
+                            "line_numbers": (prev_line, curr_line),
                             "description": f"Rule violation: {rule['description']}",
                             "details": rule_result,
                         }
-                        self.inconsistencies.append(issue)
+                        self._issues.append(issue)
                         inconsistency_count += 1
-                        logger.warning(
-                            f"⚠️  {issue['description']} (lines {prev_entry.line_number}-"
-                            f"{curr_entry.line_number})"
-                        )
+                        logger.warning(f"⚠️  {issue['description']} (lines {prev_line}-{curr_line})")
                 except Exception:
                     logger.exception("❌ Error applying rule '{rule['description']}'")
 
@@ -829,88 +1300,97 @@ class GPIOLogAnalyzer:
 
     def generate_report(self) -> str:
         """Generate analysis report."""
-        report = []
-        report.append("=" * 80)
-        report.append("GPIO LOG FILE ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append("")
+        report = io.StringIO()
+        self.write_report(report)
+        return report.getvalue().removesuffix("\n")
+
+    def write_report(self, stream: TextIO):
+        """Write the analysis report to a text stream, line by line."""
+        print("=" * 80, file=stream)
+        print("GPIO LOG FILE ANALYSIS REPORT", file=stream)
+        print("=" * 80, file=stream)
+        print(file=stream)
 
         # Summary
-        report.append("SUMMARY:")
-        report.append(f"  Total log entries: {len(self.log_entries)}")
-        report.append(f"  GPIO pins detected: {sorted(self.gpio_pins)}")
-        report.append(f"  Inconsistencies found: {len(self.inconsistencies)}")
-        report.append(f"  Header: {self.header_line}")
-        report.append(f"  Footer: {self.footer_line}")
-        report.append("")
+        print("SUMMARY:", file=stream)
+        print(f"  Total log entries: {self.sample_count}", file=stream)
+        if self.edges_only:
+            print(f"  Stored entries (edges only): {len(self)}", file=stream)
+        print(f"  GPIO pins detected: {sorted(self.gpio_pins)}", file=stream)
+        print(f"  Inconsistencies found: {len(self.inconsistencies)}", file=stream)
+        print(f"  Header: {self.header_line}", file=stream)
+        print(f"  Footer: {self.footer_line}", file=stream)
+        print(file=stream)
 
         # Validation rules applied
-        report.append("VALIDATION RULES APPLIED:")
-        report.append("  1. Initial state: All GPIO values should be 1")
-        report.append("  2. GPIO4 transitions: Should go 1->0->1 with 1-2 second timing")
-        report.append(
+        print("VALIDATION RULES APPLIED:", file=stream)
+        print("  1. Initial state: All GPIO values should be 1", file=stream)
+        print("  2. GPIO4 transitions: Should go 1->0->1 with 1-2 second timing", file=stream)
+        print(
             "  3. GPIO3 transitions: Should go 1->0->1 with 15-20 second timing, "
-            "after GPIO4 returns to 1"
+            "after GPIO4 returns to 1",
+            file=stream,
         )
-        report.append(
-            "  4. GPIO10 transitions: Should return to 1 within 4 seconds maximum when it goes to 0"
+        print(
+            "  4. GPIO10 transitions: Should return to 1 within 4 seconds maximum "
+            "when it goes to 0",
+            file=stream,
         )
-        report.append(
-            "  5. GPIO2 transitions: Should return to 1 within 25 seconds maximum when it goes to 0"
+        print(
+            "  5. GPIO2 transitions: Should return to 1 within 25 seconds maximum "
+            "when it goes to 0",
+            file=stream,
         )
-        report.append("  6. GPIO pin consistency: All pins should be present in each entry")
-        report.append("  Note: Timing validation uses millisecond precision when available")
+        print("  6. GPIO pin consistency: All pins should be present in each entry", file=stream)
+        print("  Note: Timing validation uses millisecond precision when available", file=stream)
         if self.validation_rules:
             for i, rule in enumerate(self.validation_rules, start=7):
-                report.append(f"  {i}. Custom rule: {rule['description']}")
-        report.append("")
+                print(f"  {i}. Custom rule: {rule['description']}", file=stream)
+        print(file=stream)
 
         # Time range
-        if self.log_entries:
-            first_entry = self.log_entries[0]
-            last_entry = self.log_entries[-1]
-            report.append("TIME RANGE:")
-            report.append(
-                f"  First entry: Line {first_entry.line_number} - {first_entry.timestamp_str}"
+        if len(self):
+            print("TIME RANGE:", file=stream)
+            print(
+                f"  First entry: Line {self.line_numbers[0]} - {self.timestamp_strs[0]}",
+                file=stream,
             )
-            report.append(
-                f"  Last entry:  Line {last_entry.line_number} - {last_entry.timestamp_str}"
+            print(
+                f"  Last entry:  Line {self.line_numbers[-1]} - {self.timestamp_strs[-1]}",
+                file=stream,
             )
-            report.append("")
+            print(file=stream)
 
         # Inconsistencies
         if self.inconsistencies:
-            report.append("INCONSISTENCIES FOUND:")
+            print("INCONSISTENCIES FOUND:", file=stream)
             for i, issue in enumerate(self.inconsistencies, 1):
-                report.append(f"  {i}. {issue['description']}")
+                print(f"  {i}. {issue['description']}", file=stream)
                 if "details" in issue:
                     for key, value in issue["details"].items():
                         if key not in ["valid"]:
-                            report.append(f"     {key}: {value}")
-                report.append("")
+                            print(f"     {key}: {value}", file=stream)
+                print(file=stream)
         else:
-            report.append("✅ NO INCONSISTENCIES FOUND")
-            report.append("")
+            print("✅ NO INCONSISTENCIES FOUND", file=stream)
+            print(file=stream)
 
         # GPIO state summary
-        if self.log_entries:
-            report.append("GPIO STATE SUMMARY:")
+        if len(self):
+            print("GPIO STATE SUMMARY:", file=stream)
             for pin in sorted(self.gpio_pins):
-                states = [entry.gpio_states.get(pin, -1) for entry in self.log_entries]
-                unique_states = set(states)
-                report.append(f"  GPIO{pin}: States used: {sorted(unique_states)}")
-
-        report.append("")
-        report.append("=" * 80)
+                data = self.pin_columns[pin].tobytes()
+                unique_states = [state for state, byte in _COLUMN_VALUE_BYTES if byte in data]
+                print(f"  GPIO{pin}: States used: {unique_states}", file=stream)
 
-        return "\n".join(report)
+        print(file=stream)
+        print("=" * 80, file=stream)
 
     def save_report(self, filename: str = "gpio_analysis_report.txt"):
         """Save analysis report to file."""
-        report = self.generate_report()
         try:
             with open(filename, "w") as f:
-                f.write(report)
+                self.write_report(f)
             logger.info(f"📄 Analysis report saved to {filename}")
         except Exception:
             logger.exception("❌ Failed to save report")
@@ -925,6 +1405,11 @@ def main():
         "--output", "-o", help="Output file for analysis report (default: gpio_analysis_report.txt)"
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument(
+        "--edges-only",
+        action="store_true",
+        help="Only store samples around GPIO changes (custom rules then see fewer entries)",
+    )
 
     args = parser.parse_args()
 
@@ -932,7 +1417,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Create analyzer
-    analyzer = GPIOLogAnalyzer()
+    analyzer = GPIOLogAnalyzer(edges_only=args.edges_only)
 
     try:
         # Parse log file
@@ -943,9 +1428,8 @@ def main():
         # Check consistency
         analyzer.check_consistency()
 
-        # Generate and display report
-        report = analyzer.generate_report()
-        print(report)
+        # Display report
+        analyzer.write_report(sys.stdout)
 
         # Save report
         output_file = args.output or "gpio_analysis_report.txt"
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 
 import logging
+import mmap
+import os
+import re
+import signal
 import subprocess
 import time
 from datetime import datetime
+from functools import cache
 
 
 # GPIO pins to monitor
@@ -12,6 +17,23 @@ PINS = [2, 3, 4, 10]
 # Log file path
 LOG_FILE = "/home/doorpi/gpio_monitor.log"
 
+# File log lines are buffered and appended in batches: when LOG_BUFFER_BYTES are
+# pending, on WARNING or above, or at least every LOG_FLUSH_INTERVAL seconds from the
+# main loop
+LOG_BUFFER_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL = 5.0
+
+# GPIO register block as exposed by /dev/gpiomem (the same registers raspi-gpio reads).
+# GPLEV0 holds the current level of GPIO0-31, one bit per pin. Only SoCs sharing the
+# BCM2835 register layout are supported (Raspberry Pi 1-4, Zero)
+GPIOMEM_PATH = "/dev/gpiomem"
+GPIOMEM_SOCS = (b"bcm2835", b"bcm2836", b"bcm2837", b"bcm2711")
+GPIO_BLOCK_SIZE = 4096
+GPLEV0_WORD = 0x34 // 4
+
+# Pin level in raspi-gpio output, e.g. "GPIO 2: level=1 fsel=1 func=OUTPUT pull=DOWN"
+_LEVEL_RE = re.compile(rb"level=([01])")
+
 
 class MillisecondFormatter(logging.Formatter):
     """Custom formatter to include milliseconds in timestamp."""
@@ -22,6 +44,62 @@ class MillisecondFormatter(logging.Formatter):
         return ct.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Remove last 3 digits to get milliseconds
 
 
+class BufferedFileHandler(logging.Handler):
+    """Log handler that appends formatted lines to a file in large batched writes."""
+
+    def __init__(self, filename):
+        """Open ``filename`` for appending, creating it if needed."""
+        super().__init__()
+        self.fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        self.pending = bytearray()
+
+    def emit(self, record):
+        if self.fd is None:
+            return  # Closed; there is nowhere left to write the record
+        try:
+            self.pending += f"{self.format(record)}\n".encode()
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.pending) >= LOG_BUFFER_BYTES or record.levelno >= logging.WARNING:
+            self.write_pending(record)
+
+    def flush(self):
+        """Write all pending lines with as few os.write calls as possible."""
+        self.write_pending(None)
+
+    def write_pending(self, record):
+        """Write the pending lines, reporting a failed write through handleError.
+
+        Whatever was written before a failure is dropped from the buffer, so the next
+        flush does not write it again. The rest is kept for the next attempt unless it
+        has grown past LOG_BUFFER_BYTES, in which case it is discarded.
+        """
+        with self.lock:
+            if self.fd is None:
+                return
+            written = 0
+            try:
+                with memoryview(self.pending) as pending:
+                    while written < len(pending):
+                        written += os.write(self.fd, pending[written:])
+            except OSError:
+                self.handleError(record)
+            finally:
+                del self.pending[:written]
+                if len(self.pending) >= LOG_BUFFER_BYTES:
+                    self.pending.clear()
+
+    def close(self):
+        with self.lock:
+            if self.fd is not None:
+                self.flush()
+                os.close(self.fd)
+                self.fd = None
+                self.pending.clear()  # Lines a failed final flush could not write
+        super().close()
+
+
 def setup_logger():
     logger = logging.getLogger("GPIO_Monitor")
     logger.setLevel(logging.INFO)
@@ -29,8 +107,8 @@ def setup_logger():
     # Log format with millisecond precision
     formatter = MillisecondFormatter("%(asctime)s | %(message)s")
 
-    # File handler
-    file_handler = logging.FileHandler(LOG_FILE)
+    # File handler, buffered so state changes don't cost a write each
+    file_handler = BufferedFileHandler(LOG_FILE)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
@@ -42,35 +120,60 @@ def setup_logger():
     return logger
 
 
-def read_gpio(pin):
-    """Uses 'raspi-gpio get <pin>' to read the pin status.
+@cache
+def gpio_registers():
+    """Maps the GPIO register block once, as 32-bit words.
 
-    Returns 0 or 1 depending on the detected logic level.
+    Returns None when it is not available (not a supported Raspberry Pi, or no access
+    to /dev/gpiomem), in which case pins are read through raspi-gpio.
     """
     try:
-        output = subprocess.check_output(["/usr/bin/raspi-gpio", "get", str(pin)], text=True)  # noqa: S603
-        # Example output: "GPIO 2: level=1 fsel=1 func=OUTPUT pull=DOWN"
-        if "level=1" in output:
-            return 1
-        if "level=0" in output:
-            return 0
-
+        with open("/proc/device-tree/compatible", "rb") as f:
+            compatible = f.read()
+        if not any(soc in compatible for soc in GPIOMEM_SOCS):
+            return None
+
+        fd = os.open(GPIOMEM_PATH, os.O_RDONLY | os.O_SYNC)
+        try:
+            block = mmap.mmap(fd, GPIO_BLOCK_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+
+    except OSError:
         return None
 
-    except subprocess.CalledProcessError:
-        return None
+    return memoryview(block).cast("I")
 
-    else:
-        return None
 
+def read_gpio(pin):
+    """Reads the pin status from the GPIO level register.
+
+    Falls back to 'raspi-gpio get <pin>' when the registers can't be mapped.
+    Returns 0 or 1 depending on the detected logic level.
+    """
+    registers = gpio_registers()
+    if registers is not None:
+        return (registers[GPLEV0_WORD] >> pin) & 1
+
+    try:
+        output = subprocess.check_output(["/usr/bin/raspi-gpio", "get", str(pin)])  # noqa: S603
+    except subprocess.CalledProcessError:
+        return None
 
+    match = _LEVEL_RE.search(output)
+    return int(match[1]) if match else None
 
 
 def main():
     logger = setup_logger()
     logger.info("===== STARTING GPIO MONITORING =====")
 
+    # Stop on SIGTERM (e.g. systemd) the same way as on Ctrl+C, so the footer is
+    # logged and buffered records are written out
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
     previous_states = {}
+    last_flush = time.monotonic()
 
     try:
         while True:
@@ -92,6 +195,11 @@ def main():
                 logger.info(states_str)
                 previous_states = current_states
 
+            if time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL:
+                for handler in logger.handlers:
+                    handler.flush()
+                last_flush = time.monotonic()
+
             time.sleep(0.5)  # half a second between reads
 
     except KeyboardInterrupt:
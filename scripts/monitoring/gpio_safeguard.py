@@ -16,6 +16,10 @@ Safety Rules:
 
 import argparse
 import logging
+import logging.handlers
+import mmap
+import os
+import re
 import subprocess
 import sys
 import time
@@ -33,9 +37,30 @@ SAFETY_RULES = {
     4: 2.0,  # GPIO4: max 2 seconds at 0
 }
 
+# Safety rules in nanoseconds, compared against time.monotonic_ns() differences
+SAFETY_RULES_NS = {pin: int(seconds * 1e9) for pin, seconds in SAFETY_RULES.items()}
+
+# Seconds between checks (adjust for responsiveness vs CPU usage)
+POLL_INTERVAL = 0.1
+
 # Log file path
 LOG_FILE = "/home/doorpi/gpio_safeguard.log"
 
+# File log records are buffered and written in batches: when the buffer fills up,
+# immediately on WARNING or above (safety violations), and on every status report
+LOG_BUFFER_CAPACITY = 64
+
+# GPIO register block as exposed by /dev/gpiomem (the same registers raspi-gpio reads).
+# GPLEV0 holds the current level of GPIO0-31, one bit per pin. Only SoCs sharing the
+# BCM2835 register layout are supported (Raspberry Pi 1-4, Zero)
+GPIOMEM_PATH = "/dev/gpiomem"
+GPIOMEM_SOCS = (b"bcm2835", b"bcm2836", b"bcm2837", b"bcm2711")
+GPIO_BLOCK_SIZE = 4096
+GPLEV0_WORD = 0x34 // 4
+
+# Pin and level in raspi-gpio output, e.g. "GPIO 2: level=1 fsel=1 func=OUTPUT pull=DOWN"
+_LEVEL_RE = re.compile(rb"GPIO (\d+): level=([01])")
+
 
 class MillisecondFormatter(logging.Formatter):
     """Custom formatter to include milliseconds in timestamp."""
@@ -54,9 +79,10 @@ class GPIOSafeguard:
         self.dry_run = dry_run
         self.logger = self.setup_logger()
         self.gpio_states = {}
-        self.gpio_timers = {}  # Track when GPIOs went to 0
+        self.gpio_timers = {}  # Track when GPIOs went to 0 (time.monotonic_ns())
         self.violations_count = 0
         self.corrections_made = 0
+        self.gpio_registers = self.map_gpio_registers()
 
     def setup_logger(self):
         """Setup logging with millisecond precision."""
@@ -69,10 +95,14 @@ class GPIOSafeguard:
         # Log format with millisecond precision
         formatter = MillisecondFormatter("%(asctime)s | %(levelname)s | %(message)s")
 
-        # File handler
+        # File handler, behind a buffer so routine INFO records are written in batches
         file_handler = logging.FileHandler(LOG_FILE)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(
+            logging.handlers.MemoryHandler(
+                LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+            )
+        )
 
         # Console handler
         console_handler = logging.StreamHandler()
@@ -81,25 +111,83 @@ class GPIOSafeguard:
 
         return logger
 
+    def flush_logs(self):
+        """Write out any buffered log records."""
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def map_gpio_registers(self) -> Optional[memoryview]:
+        """Map the GPIO register block so pin levels can be read without raspi-gpio.
+
+        Returns the registers as 32-bit words, or None when they are not available
+        (not a supported Raspberry Pi, or no access to /dev/gpiomem).
+        """
+        try:
+            with open("/proc/device-tree/compatible", "rb") as f:
+                compatible = f.read()
+            if not any(soc in compatible for soc in GPIOMEM_SOCS):
+                self.logger.info(
+                    "ℹ️  Unsupported SoC for /dev/gpiomem, reading GPIOs via raspi-gpio"
+                )
+                return None
+
+            fd = os.open(GPIOMEM_PATH, os.O_RDONLY | os.O_SYNC)
+            try:
+                block = mmap.mmap(fd, GPIO_BLOCK_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+            finally:
+                os.close(fd)
+
+        except OSError as e:
+            self.logger.info(f"ℹ️  Cannot map {GPIOMEM_PATH} ({e}), reading GPIOs via raspi-gpio")
+            return None
+
+        return memoryview(block).cast("I")
+
     def read_gpio(self, pin: int) -> Optional[int]:
-        """Read GPIO pin state using raspi-gpio command.
+        """Read GPIO pin state from the level register, or using raspi-gpio command.
 
         Returns 0, 1, or None if error.
         """
+        if self.gpio_registers is not None:
+            return (self.gpio_registers[GPLEV0_WORD] >> pin) & 1
+
         try:
             output = subprocess.check_output(  # noqa: S603
-                ["/usr/bin/raspi-gpio", "get", str(pin)], text=True, stderr=subprocess.DEVNULL
+                ["/usr/bin/raspi-gpio", "get", str(pin)], stderr=subprocess.DEVNULL
             )
-            # Example output: "GPIO 2: level=1 fsel=1 func=OUTPUT pull=DOWN"
-            if "level=1" in output:
-                return 1
-            if "level=0" in output:
-                return 0
-
         except subprocess.CalledProcessError as e:
             self.logger.warning(f"Failed to read GPIO{pin}: {e}")
+            return None
+
+        match = _LEVEL_RE.search(output)
+        return int(match[2]) if match else None
+
+    def read_all(self) -> dict[int, Optional[int]]:
+        """Read the state of all monitored GPIO pins at once.
+
+        Uses a single register read, or a single raspi-gpio command for all pins.
+        Returns a dict mapping each pin to 0, 1, or None if error.
+        """
+        if self.gpio_registers is not None:
+            levels = self.gpio_registers[GPLEV0_WORD]
+            return {pin: (levels >> pin) & 1 for pin in MONITORED_PINS}
 
-        return None
+        states = dict.fromkeys(MONITORED_PINS)
+        try:
+            output = subprocess.check_output(  # noqa: S603
+                ["/usr/bin/raspi-gpio", "get", ",".join(map(str, MONITORED_PINS))],
+                stderr=subprocess.DEVNULL,
+            )
+        except subprocess.CalledProcessError as e:
+            self.logger.warning(f"Failed to read GPIOs {MONITORED_PINS}: {e}")
+            return states
+
+        # One line per pin
+        for pin, level in _LEVEL_RE.findall(output):
+            if int(pin) in states:
+                states[int(pin)] = int(level)
+
+        return states
 
     def set_gpio(self, pin: int, value: int, max_retries: int = 3) -> bool:
         """Set GPIO pin to specified value (0 or 1) with verification and retries.
@@ -121,8 +209,10 @@ class GPIOSafeguard:
 
                 subprocess.check_call(cmd, stderr=subprocess.DEVNULL)  # noqa: S603
 
-                # Verify the change by reading back the pin state
-                time.sleep(0.01)  # Brief delay to ensure the change has taken effect
+                # Verify the change by reading back the pin state. The level register
+                # already shows the driven output once raspi-gpio has returned
+                if self.gpio_registers is None:
+                    time.sleep(0.01)  # Brief delay to ensure the change has taken effect
                 actual_value = self.read_gpio(pin)
 
                 if actual_value == value:
@@ -175,8 +265,9 @@ class GPIOSafeguard:
         """Initialize all monitored GPIOs to safe state (1)."""
         self.logger.info("🔄 Initializing GPIOs to safe state...")
 
+        states = self.read_all()
         for pin in MONITORED_PINS:
-            current_state = self.read_gpio(pin)
+            current_state = states[pin]
             if current_state is None:
                 self.logger.error(f"❌ Cannot read GPIO{pin} during initialization")
                 continue
@@ -195,13 +286,16 @@ class GPIOSafeguard:
             self.gpio_states[pin] = 1  # Assume safe state after initialization
             self.gpio_timers[pin] = None
 
-    def check_safety_violations(self):
-        """Check for safety rule violations and take corrective action."""
-        current_time = datetime.now()
+    def check_safety_violations(self, now_ns: int):
+        """Check for safety rule violations at ``now_ns`` and take corrective action.
+
+        ``now_ns`` is a time.monotonic_ns() reading.
+        """
         violations_detected = False
 
+        states = self.read_all()
         for pin in MONITORED_PINS:
-            current_state = self.read_gpio(pin)
+            current_state = states[pin]
 
             if current_state is None:
                 continue
@@ -215,14 +309,14 @@ class GPIOSafeguard:
 
                 if current_state == 0:
                     # GPIO went to 0, start timer
-                    self.gpio_timers[pin] = current_time
+                    self.gpio_timers[pin] = now_ns
                     self.logger.info(
                         f"⏱️  GPIO{pin} timer started (max {SAFETY_RULES[pin]}s allowed)"
                     )
                 elif current_state == 1:
                     # GPIO returned to 1, clear timer
                     if self.gpio_timers[pin] is not None:
-                        duration = (current_time - self.gpio_timers[pin]).total_seconds()
+                        duration = (now_ns - self.gpio_timers[pin]) / 1e9
                         self.logger.info(
                             f"✅ GPIO{pin} returned to safe state after {duration:.3f}s"
                         )
@@ -230,12 +324,13 @@ class GPIOSafeguard:
 
             # Check for safety violations (GPIO at 0 for too long)
             if current_state == 0 and self.gpio_timers[pin] is not None:
-                elapsed = (current_time - self.gpio_timers[pin]).total_seconds()
-                max_allowed = SAFETY_RULES[pin]
+                elapsed_ns = now_ns - self.gpio_timers[pin]
 
-                if elapsed > max_allowed:
+                if elapsed_ns > SAFETY_RULES_NS[pin]:
                     violations_detected = True
                     self.violations_count += 1
+                    elapsed = elapsed_ns / 1e9
+                    max_allowed = SAFETY_RULES[pin]
 
                     self.logger.warning(
                         f"🚨 SAFETY VIOLATION: GPIO{pin} at 0 for {elapsed:.3f}s "
@@ -260,13 +355,27 @@ class GPIOSafeguard:
 
         return violations_detected
 
-    def get_status_summary(self) -> str:
-        """Get current status summary."""
+    def next_check_delay(self, now_ns: int) -> float:
+        """Get how long to sleep before the next check, counted from ``now_ns``.
+
+        Normally POLL_INTERVAL, but shorter when a GPIO's safety deadline expires
+        sooner, so the violation is handled on time instead of on the next poll.
+        """
+        delay = POLL_INTERVAL
+        for pin, started in self.gpio_timers.items():
+            if started is not None:
+                remaining = (SAFETY_RULES_NS[pin] - (now_ns - started)) / 1e9
+                if 0 < remaining < delay:
+                    delay = remaining
+        return delay
+
+    def get_status_summary(self, now_ns: int) -> str:
+        """Get the status summary as of ``now_ns``."""
         status_parts = []
         for pin in MONITORED_PINS:
             state = self.gpio_states.get(pin, "UNKNOWN")
             if state == 0 and self.gpio_timers[pin] is not None:
-                elapsed = (datetime.now() - self.gpio_timers[pin]).total_seconds()
+                elapsed = (now_ns - self.gpio_timers[pin]) / 1e9
                 max_allowed = SAFETY_RULES[pin]
                 status_parts.append(f"GPIO{pin}={state}({elapsed:.1f}s/{max_allowed}s)")
             else:
@@ -286,31 +395,34 @@ class GPIOSafeguard:
             self.initialize_gpios()
         else:
             # In dry-run mode, just read current states
-            for pin in MONITORED_PINS:
-                state = self.read_gpio(pin)
+            for pin, state in self.read_all().items():
                 self.gpio_states[pin] = state
                 self.gpio_timers[pin] = None
                 self.logger.info(f"📊 GPIO{pin} current state: {state}")
 
-        last_status_time = datetime.now()
+        status_interval_ns = status_interval * 1_000_000_000
+        last_status_ns = time.monotonic_ns()
 
         try:
             while True:
+                # One clock reading serves the whole iteration
+                now_ns = time.monotonic_ns()
+
                 # Check for violations and take corrective action
-                self.check_safety_violations()
+                self.check_safety_violations(now_ns)
 
                 # Periodic status report
-                current_time = datetime.now()
-                if (current_time - last_status_time).total_seconds() >= status_interval:
-                    status = self.get_status_summary()
+                if now_ns - last_status_ns >= status_interval_ns:
+                    status = self.get_status_summary(now_ns)
                     self.logger.info(
                         f"📊 Status: {status} | Violations: {self.violations_count} | "
                         f"Corrections: {self.corrections_made}"
                     )
-                    last_status_time = current_time
+                    self.flush_logs()
+                    last_status_ns = now_ns
 
-                # Sleep between checks (adjust for responsiveness vs CPU usage)
-                time.sleep(0.1)  # Check every 100ms for fast response
+                # Sleep until the next poll or the nearest safety deadline
+                time.sleep(self.next_check_delay(now_ns))
 
         except KeyboardInterrupt:
             self.logger.info("\n⏹️  Safeguard system stopped by user")
@@ -318,6 +430,7 @@ class GPIOSafeguard:
             self.logger.info(f"   Total violations detected: {self.violations_count}")
             self.logger.info(f"   Total corrections made: {self.corrections_made}")
             self.logger.info("===== GPIO SAFEGUARD STOPPED =====")
+            self.flush_logs()
 
 
 def main():
@@ -343,8 +456,8 @@ def main():
 
     # Verify we can read GPIOs before starting
     gpio_accessible = True
-    for pin in MONITORED_PINS:
-        if safeguard.read_gpio(pin) is None:
+    for pin, state in safeguard.read_all().items():
+        if state is None:
             safeguard.logger.error(f"❌ Cannot access GPIO{pin}")
             gpio_accessible = False
 
@@ -11,87 +11,233 @@ Based on ha_test_runner.py for Home Assistant API communication.
 import argparse
 import json
 import logging
+import logging.handlers
 import random
+import signal
+import socket
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
+try:
+    from .ha_websocket import HomeAssistantWebSocket
+except ImportError:  # Run as a script, with this directory on sys.path
+    from ha_websocket import HomeAssistantWebSocket
+
+
+LOG_FILE = "door_cycler.log"
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
+# File log records are buffered and written in batches: when the buffer is full, on
+# WARNING or above, after every cycle and at exit
+LOG_BUFFER_CAPACITY = 64
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("door_cycler.log"), logging.StreamHandler()],
+    handlers=[
+        logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=logging.handlers.RotatingFileHandler(
+                LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True
+            ),
+        ),
+        logging.StreamHandler(),
+    ],
 )
 logger = logging.getLogger(__name__)
 
+# Transient HTTP failures are retried on the pooled connection. Reads and 5xx
+# responses are only retried for GET: repeating a door command could toggle it back
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Cover states reported while a door is moving. Doors take a while to finish from
+# there, so they are polled at the slow interval; otherwise at the fast one
+MOVING_STATES = ("opening", "closing")
+
 
 class DoorCycler:
     """Tool for cycling garage doors through open/close cycles."""
 
-    def __init__(self, ha_url: str, token: str, timeout: int = 10):
+    def __init__(
+        self,
+        ha_url: str,
+        token: str,
+        timeout: int = 10,
+        *,
+        use_websocket: bool = False,
+        open_close_pause: float = 2.0,
+    ):
         """Initialize the DoorCycler class."""
         self.ha_url = ha_url.rstrip("/")
+        self.token = token
+        # Wait for door state changes over the WebSocket API instead of polling
+        self.use_websocket = use_websocket
+        # Pause between the doors reporting open and the close command; 0 disables it
+        self.open_close_pause = open_close_pause
         self.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        # One session for all calls, so polls reuse the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Commands for both doors are sent concurrently over the session
+        self.executor = ThreadPoolExecutor(max_workers=2)
         self.timeout = timeout
         self.cycle_count = 0
+        # Set on Ctrl+C, to stop after the current cycle and cut the wait between cycles short
+        self.stop_event = threading.Event()
         self.door_entities = {"main": "cover.garage_door", "internal": "cover.internal_garage_door"}
 
+        # URLs and payloads used on every poll and command are built once here
+        self.door_entity_ids = frozenset(self.door_entities.values())
+        self.api_url = f"{self.ha_url}/api/"
+        self.states_url = f"{self.ha_url}/api/states"
+        self.state_urls = {
+            entity_id: f"{self.states_url}/{entity_id}" for entity_id in self.door_entity_ids
+        }
+        self.service_urls = {
+            service: f"{self.ha_url}/api/services/cover/{service}"
+            for service in ("open_cover", "close_cover")
+        }
+        # Service call bodies are serialized once too and sent as raw JSON bytes
+        self.service_payloads = {
+            entity_id: json.dumps({"entity_id": entity_id}).encode()
+            for entity_id in self.door_entity_ids
+        }
+        # Display names for log lines, e.g. "Garage Door" for cover.garage_door
+        self.door_names = {}
+        for entity_id in self.door_entity_ids:
+            self.door_name(entity_id)
+
+    def door_name(self, entity_id: str) -> str:
+        """Return the display name of an entity, formatting it only once."""
+        name = self.door_names.get(entity_id)
+        if name is None:
+            name = entity_id.split(".")[-1].replace("_", " ").title()
+            self.door_names[entity_id] = name
+        return name
+
     def make_request(
-        self, method: str, endpoint: str, data: Optional[dict] = None
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[dict, bytes]] = None,
+        *,
+        parse_json: bool = True,
     ) -> tuple[int, dict, float]:
-        """Make HTTP request to Home Assistant API."""
-        url = f"{self.ha_url}{endpoint}"
-        start_time = time.time()
-
+        """Make HTTP request to Home Assistant API.
+
+        Args:
+            method: HTTP method, GET or POST.
+            url: Full request URL, usually one of the precomputed ones.
+            data: Optional JSON body, as a dict or already serialized to bytes.
+            parse_json: Decode the body of successful responses. When False, the
+                body is only decoded for error responses, and an empty dict is
+                returned otherwise.
+        """
+        if method.upper() not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        start_time = time.monotonic()
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            end_time = time.time()
+            body = {"data": data} if isinstance(data, bytes) else {"json": data}
+            response = self.session.request(method.upper(), url, timeout=self.timeout, **body)
+        except requests.exceptions.RequestException as e:
+            end_time = time.monotonic()
             response_time = end_time - start_time
+            return 0, {"error": str(e)}, response_time
 
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"text": response.text}
+        end_time = time.monotonic()
+        response_time = end_time - start_time
 
-            else:
-                return response.status_code, response_data, response_time
+        if not parse_json and response.ok:
+            return response.status_code, {}, response_time
 
-        except requests.exceptions.RequestException as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-            return 0, {"error": str(e)}, response_time
+        try:
+            response_data = response.json()
+        except json.JSONDecodeError:
+            response_data = {"text": response.text}
+
+        return response.status_code, response_data, response_time
+
+    def close(self):
+        """Stop the command workers and close the HTTP session and its pooled connections."""
+        self.executor.shutdown()
+        self.session.close()
+
+    def send_command_to_both_doors(self, service: str) -> bool:
+        """Send the same command to both doors concurrently; True if both succeeded."""
+        futures = [
+            self.executor.submit(self.send_door_command, entity_id, service)
+            for entity_id in self.door_entities.values()
+        ]
+        # Wait for every command, even after a failure, before reporting
+        results = [future.result() for future in futures]
+        return all(results)
 
     def get_door_state(self, entity_id: str) -> str:
         """Get current state of a door entity."""
-        endpoint = f"/api/states/{entity_id}"
-        status_code, response_data, response_time = self.make_request("GET", endpoint)
+        url = self.state_urls.get(entity_id) or f"{self.states_url}/{entity_id}"
+        status_code, response_data, response_time = self.make_request("GET", url)
 
         if status_code == requests.codes.ok:
             state = response_data.get("state", "unknown")
-            logger.debug(f"Door {entity_id} state: {state} ({response_time:.3f}s)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Door {entity_id} state: {state} ({response_time:.3f}s)")
             return state
         logger.error(f"Failed to get state for {entity_id}: HTTP {status_code}")
         return "unknown"
 
+    def get_all_door_states(self) -> dict[str, str]:
+        """Get the current state of every door entity with a single request."""
+        status_code, response_data, response_time = self.make_request("GET", self.states_url)
+
+        if status_code != requests.codes.ok or not isinstance(response_data, list):
+            logger.error(f"Failed to get door states: HTTP {status_code}")
+            return {}
+
+        states = {
+            entity["entity_id"]: entity.get("state", "unknown")
+            for entity in response_data
+            if entity.get("entity_id") in self.door_entity_ids
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Door states: {states} ({response_time:.3f}s)")
+        return states
+
     def send_door_command(self, entity_id: str, service: str) -> bool:
         """Send a command to a door entity."""
-        endpoint = f"/api/services/cover/{service}"
-        data = {"entity_id": entity_id}
+        url = self.service_urls.get(service) or f"{self.ha_url}/api/services/cover/{service}"
+        data = self.service_payloads.get(entity_id) or json.dumps({"entity_id": entity_id}).encode()
 
-        status_code, response_data, response_time = self.make_request("POST", endpoint, data)
+        # Only the status matters here; the body (the changed states) is only logged on failure
+        status_code, response_data, response_time = self.make_request(
+            "POST", url, data, parse_json=False
+        )
 
         success = status_code == requests.codes.ok
-        door_name = entity_id.split(".")[-1].replace("_", " ").title()
+        door_name = self.door_name(entity_id)
 
         if success:
             logger.info(f"✅ {door_name}: {service} command sent ({response_time:.3f}s)")
@@ -101,55 +247,169 @@ class DoorCycler:
 
         return success
 
-    def wait_for_door_state(self, entity_id: str, target_state: str, max_wait: int = 60) -> bool:
-        """Wait for a door to reach the target state."""
-        door_name = entity_id.split(".")[-1].replace("_", " ").title()
+    def wait_for_door_state(
+        self,
+        entity_id: str,
+        target_state: str,
+        max_wait: int = 60,
+        *,
+        initial_delay: float = 5.0,
+        fast_interval: float = 1.0,
+        slow_interval: float = 2.0,
+    ) -> bool:
+        """Wait for a door to reach the target state.
+
+        The first poll happens after ``initial_delay``, as doors never get there
+        sooner. Then it polls every ``slow_interval`` while the door is moving and
+        every ``fast_interval`` otherwise.
+        """
+        door_name = self.door_name(entity_id)
         logger.info(f"⏳ Waiting for {door_name} to reach '{target_state}' state...")
 
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
+        last_state = None
+        start_time = time.monotonic()
+        time.sleep(min(initial_delay, max_wait))
+        while time.monotonic() - start_time < max_wait:
             current_state = self.get_door_state(entity_id)
 
             if current_state == target_state:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 logger.info(f"✅ {door_name} reached '{target_state}' state ({elapsed:.1f}s)")
                 return True
-            if current_state in ["unavailable", "unknown"]:
+            # Warn once when the door becomes unavailable/unknown, not on every poll
+            if current_state in ["unavailable", "unknown"] and current_state != last_state:
                 logger.warning(f"⚠️  {door_name} state is {current_state}")
+            last_state = current_state
 
-            time.sleep(2)  # Check every 2 seconds
+            time.sleep(slow_interval if current_state in MOVING_STATES else fast_interval)
 
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         logger.error(
             f"❌ {door_name} did not reach '{target_state}' state "
             f"within {max_wait}s (elapsed: {elapsed:.1f}s)"
         )
         return False
 
-    def wait_for_both_doors_state(self, target_state: str, max_wait: int = 60) -> bool:
-        """Wait for both doors to reach the target state."""
+    def wait_for_both_doors_state(
+        self,
+        target_state: str,
+        max_wait: int = 60,
+        *,
+        initial_delay: float = 5.0,
+        fast_interval: float = 1.0,
+        slow_interval: float = 2.0,
+    ) -> bool:
+        """Wait for both doors to reach the target state.
+
+        With use_websocket set, state_changed events are watched as they happen.
+        Otherwise, or if the WebSocket connection fails, both doors are polled with
+        one request on the same schedule as wait_for_door_state, using the slow
+        interval while any door still being waited for is moving.
+        """
         logger.info(f"⏳ Waiting for both doors to reach '{target_state}' state...")
 
-        main_success = self.wait_for_door_state(self.door_entities["main"], target_state, max_wait)
-        internal_success = self.wait_for_door_state(
-            self.door_entities["internal"], target_state, max_wait
-        )
+        # Doors still being waited for, with the last state seen for each
+        pending = dict.fromkeys(self.door_entity_ids)
+        start_time = time.monotonic()
+        if not (
+            self.use_websocket
+            and self._watch_door_states(pending, target_state, start_time, max_wait)
+        ):
+            time.sleep(min(initial_delay, max(max_wait - (time.monotonic() - start_time), 0)))
+            while pending and time.monotonic() - start_time < max_wait:
+                states = self.get_all_door_states()
+                self._mark_reached_doors(pending, states, target_state, start_time)
+                if not pending:
+                    break
+
+                moving = any(states.get(entity_id) in MOVING_STATES for entity_id in pending)
+                time.sleep(slow_interval if moving else fast_interval)
 
-        if main_success and internal_success:
+        if not pending:
             logger.info(f"✅ Both doors reached '{target_state}' state")
             return True
+
+        elapsed = time.monotonic() - start_time
+        for entity_id in sorted(pending):
+            door_name = self.door_name(entity_id)
+            logger.error(
+                f"❌ {door_name} did not reach '{target_state}' state "
+                f"within {max_wait}s (elapsed: {elapsed:.1f}s)"
+            )
         logger.error(f"❌ One or both doors failed to reach '{target_state}' state")
         return False
 
+    def _mark_reached_doors(
+        self,
+        pending: dict[str, Optional[str]],
+        states: dict[str, str],
+        target_state: str,
+        start_time: float,
+    ) -> None:
+        """Drop the doors that reached the target state from pending, logging each one.
+
+        Doors that are still pending get their last seen state updated, so an
+        unavailable/unknown state is only warned about when it first shows up.
+        """
+        elapsed = time.monotonic() - start_time
+        for entity_id in sorted(pending):
+            if entity_id not in states:
+                continue
+            door_name = self.door_name(entity_id)
+            current_state = states[entity_id]
+
+            if current_state == target_state:
+                logger.info(f"✅ {door_name} reached '{target_state}' state ({elapsed:.1f}s)")
+                del pending[entity_id]
+                continue
+            if current_state in ["unavailable", "unknown"] and current_state != pending[entity_id]:
+                logger.warning(f"⚠️  {door_name} state is {current_state}")
+            pending[entity_id] = current_state
+
+    def _watch_door_states(
+        self,
+        pending: dict[str, Optional[str]],
+        target_state: str,
+        start_time: float,
+        max_wait: int,
+    ) -> bool:
+        """Watch state_changed events until the pending doors reach the target state.
+
+        Returns:
+            False if the WebSocket connection failed and polling should take over,
+            True otherwise (including a timeout).
+        """
+        try:
+            with HomeAssistantWebSocket(self.ha_url, self.token, self.timeout) as ws:
+                ws.subscribe_state_changes()
+                # The doors may have changed before the subscription, so start from
+                # a snapshot and only then apply the events
+                states = self.get_all_door_states()
+                states = {entity_id: states.get(entity_id, "unknown") for entity_id in pending}
+                self._mark_reached_doors(pending, states, target_state, start_time)
+
+                while pending:
+                    remaining = max_wait - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        break
+                    try:
+                        entity_id, state = ws.next_state_change(remaining)
+                    except socket.timeout:
+                        break
+                    if entity_id in pending:
+                        states = {entity_id: state or "unknown"}
+                        self._mark_reached_doors(pending, states, target_state, start_time)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  WebSocket unavailable ({e}), falling back to polling")
+            return False
+        return True
+
     def open_both_doors(self) -> bool:
         """Open both garage doors."""
         logger.info("🚪 Opening both garage doors...")
 
         # Send open commands to both doors
-        main_success = self.send_door_command(self.door_entities["main"], "open_cover")
-        internal_success = self.send_door_command(self.door_entities["internal"], "open_cover")
-
-        if not (main_success and internal_success):
+        if not self.send_command_to_both_doors("open_cover"):
             logger.error("❌ Failed to send open commands to one or both doors")
             return False
 
@@ -161,10 +421,7 @@ class DoorCycler:
         logger.info("🚪 Closing both garage doors...")
 
         # Send close commands to both doors
-        main_success = self.send_door_command(self.door_entities["main"], "close_cover")
-        internal_success = self.send_door_command(self.door_entities["internal"], "close_cover")
-
-        if not (main_success and internal_success):
+        if not self.send_command_to_both_doors("close_cover"):
             logger.error("❌ Failed to send close commands to one or both doors")
             return False
 
@@ -183,7 +440,8 @@ class DoorCycler:
             return False
 
         logger.info("✅ Doors opened successfully")
-        time.sleep(2)  # Brief pause between open and close
+        if self.open_close_pause > 0:
+            time.sleep(self.open_close_pause)  # Brief pause between open and close
 
         # Close both doors
         if not self.close_both_doors():
@@ -195,20 +453,26 @@ class DoorCycler:
 
     def run_continuous_cycling(self, max_cycles: Optional[int] = None):
         """Run continuous door cycling with random intervals."""
-        logger.info("🚀 Starting garage door cycling tool")
-        logger.info(f"Target: {self.ha_url}")
-        logger.info(f"Main door: {self.door_entities['main']}")
-        logger.info(f"Internal door: {self.door_entities['internal']}")
-        logger.info("Random wait interval: 15-30 seconds")
-        if max_cycles:
-            logger.info(f"Maximum cycles: {max_cycles}")
-        else:
-            logger.info("Maximum cycles: Unlimited (Ctrl+C to stop)")
-        logger.info("=" * 60)
-        max_seconds = 5
-
+        # The banner is logged as a single multi-line record
+        max_cycles_line = (
+            f"Maximum cycles: {max_cycles}"
+            if max_cycles
+            else "Maximum cycles: Unlimited (Ctrl+C to stop)"
+        )
+        banner = [
+            "🚀 Starting garage door cycling tool",
+            f"Target: {self.ha_url}",
+            f"Main door: {self.door_entities['main']}",
+            f"Internal door: {self.door_entities['internal']}",
+            "Random wait interval: 15-30 seconds",
+            max_cycles_line,
+            "=" * 60,
+        ]
+        logger.info("\n".join(banner))
+
+        previous_handler = signal.signal(signal.SIGINT, self.request_stop)
         try:
-            while True:
+            while not self.stop_event.is_set():
                 # Check if we've reached the maximum cycles
                 if max_cycles and self.cycle_count >= max_cycles:
                     logger.info(f"🏁 Reached maximum cycles ({max_cycles}), stopping")
@@ -216,6 +480,8 @@ class DoorCycler:
 
                 # Perform one cycle
                 cycle_success = self.perform_cycle()
+                for handler in logging.getLogger().handlers:
+                    handler.flush()
 
                 if not cycle_success:
                     logger.error("❌ Cycle failed, stopping continuous operation")
@@ -224,32 +490,33 @@ class DoorCycler:
                 # Random wait between cycles (15-30 seconds)
                 wait_time = random.randint(15, 30)  # noqa: S311
                 logger.info(f"⏰ Waiting {wait_time} seconds before next cycle...")
+                self.stop_event.wait(wait_time)
 
-                # Sleep with periodic status updates
-                for remaining in range(wait_time, 0, -5):
-                    if remaining <= max_seconds:
-                        logger.info(f"   Starting next cycle in {remaining} seconds...")
-                        time.sleep(remaining)
-                        break
-                    time.sleep(5)
-                    if remaining % 10 == 0:  # Status update every 10 seconds
-                        logger.info(f"   Next cycle in {remaining} seconds...")
-
+            if self.stop_event.is_set():
+                logger.info("⏹️  Cycling stopped by user (Ctrl+C)")
         except KeyboardInterrupt:
-            logger.info("\n⏹️  Cycling stopped by user (Ctrl+C)")
+            logger.info("\n⏹️  Cycling aborted by user (Ctrl+C)")
         except Exception:
             logger.exception("❌ Unexpected error")
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+
+        logger.info(f"📊 Total cycles completed: {self.cycle_count}\n🏁 Door cycling tool finished")
 
-        logger.info(f"📊 Total cycles completed: {self.cycle_count}")
-        logger.info("🏁 Door cycling tool finished")
+    def request_stop(self, _signum: int, _frame) -> None:
+        """Handle SIGINT: stop after the current cycle, or abort right away if repeated."""
+        if self.stop_event.is_set():
+            raise KeyboardInterrupt
+        logger.info("\n⏹️  Stopping after the current cycle (Ctrl+C again to abort)")
+        self.stop_event.set()
 
     def test_connectivity(self) -> bool:
         """Test connectivity to Home Assistant and door entities."""
         logger.info("🔍 Testing connectivity to Home Assistant...")
 
-        # Test basic connectivity
-        endpoint = "/api/states"
-        status_code, response_data, response_time = self.make_request("GET", endpoint)
+        # Test basic connectivity against the API root, which answers with a tiny body
+        # instead of every entity in the instance
+        status_code, _, response_time = self.make_request("GET", self.api_url, parse_json=False)
 
         if status_code != requests.codes.ok:
             logger.error(f"❌ Failed to connect to Home Assistant: HTTP {status_code}")
@@ -257,9 +524,9 @@ class DoorCycler:
 
         logger.info(f"✅ Connected to Home Assistant ({response_time:.3f}s)")
 
-        # Test door entity availability
-        for door_name, entity_id in self.door_entities.items():
-            state = self.get_door_state(entity_id)
+        # Test door entity availability, querying both doors concurrently
+        states = self.executor.map(self.get_door_state, self.door_entities.values())
+        for (door_name, entity_id), state in zip(self.door_entities.items(), states):
             if state == "unknown":
                 logger.error(f"❌ {door_name.title()} door entity ({entity_id}) not available")
                 return False
@@ -285,11 +552,28 @@ def main():
     parser.add_argument(
         "--test-only", action="store_true", help="Test connectivity only, do not run cycles"
     )
+    parser.add_argument(
+        "--use-websocket",
+        action="store_true",
+        help="Watch door state changes over the WebSocket API instead of polling",
+    )
+    parser.add_argument(
+        "--open-close-pause",
+        type=float,
+        default=2.0,
+        help="Seconds to wait between doors opening and closing, 0 to skip (default: 2.0)",
+    )
 
     args = parser.parse_args()
 
     # Create door cycler instance
-    cycler = DoorCycler(args.url, args.token, args.timeout)
+    cycler = DoorCycler(
+        args.url,
+        args.token,
+        args.timeout,
+        use_websocket=args.use_websocket,
+        open_close_pause=args.open_close_pause,
+    )
 
     try:
         # Test connectivity first
@@ -307,6 +591,8 @@ def main():
     except Exception:
         logger.exception("❌ Tool failed")
         sys.exit(1)
+    finally:
+        cycler.close()
 
 
 if __name__ == "__main__":
@@ -7,143 +7,541 @@ detailed results and timing information.
 """
 
 import argparse
+import contextlib
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import socket
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+try:
+    from .ha_websocket import HomeAssistantWebSocket
+except ImportError:  # Run as a script, with this directory on sys.path
+    from ha_websocket import HomeAssistantWebSocket
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("ha_test_results.log"), logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
+# Transient HTTP failures are retried on the pooled connection. Reads and 5xx
+# responses are only retried for GET, so a service call is never sent twice
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Independent read-only tests run concurrently on this many workers, one per
+# pooled connection
+MAX_CONCURRENT_REQUESTS = 4
+
+# States that show a service call took effect. Between tests the runner polls the
+# entity until it reaches one of them, instead of sleeping a fixed time
+SETTLED_STATES = {
+    "open_cover": {"opening", "open"},
+    "close_cover": {"closing", "closed"},
+    "stop_cover": {"open", "closed"},
+    "turn_on": {"on"},
+    "turn_off": {"off"},
+}
+STATE_POLL_INTERVAL = 0.1
+# A door reports "opening" right after the command, so stop tests are still sent this
+# many seconds after the open, to stop a door that is actually travelling
+STOP_AFTER_TRAVEL = 2.0
+
+
+class TestSpec(NamedTuple):
+    """One REST call of the test plan."""
+
+    test_id: str
+    method: str
+    endpoint: str
+    entity_id: str
+    service: str
+    description: str
+    expected_status: int = requests.codes.ok
+    # Advisory tests check behaviour that differs between Home Assistant versions; a 2xx
+    # instead of the expected status is reported as a warning rather than a failure
+    advisory: bool = False
+    # Least time, in seconds, between sending the previous call and this one
+    min_delay: float = 0.0
+
+
+def service_test(
+    test_id: str,
+    entity_id: str,
+    service: str,
+    description: str,
+    expected_status: int = requests.codes.ok,
+    *,
+    advisory: bool = False,
+    min_delay: float = 0.0,
+) -> TestSpec:
+    """Build the spec of a service call on an entity, in the entity's own domain."""
+    domain = entity_id.split(".", 1)[0]
+    return TestSpec(
+        test_id,
+        "POST",
+        f"/api/services/{domain}/{service}",
+        entity_id,
+        service,
+        description,
+        expected_status,
+        advisory,
+        min_delay,
+    )
+
+
+def status_matches(status_code: int, expected_status: int) -> bool:
+    """Return whether a response status is the one a test expects.
+
+    An expected client error accepts any 4xx, since Home Assistant versions differ
+    in which one they send for an invalid call.
+    """
+    if expected_status >= requests.codes.bad_request:
+        return requests.codes.bad_request <= status_code < requests.codes.internal_server_error
+    return status_code == expected_status
+
+
+# The test plan is static, so its calls are built once. Each suite runs in this order
+COVER_TEST_PLAN = (
+    service_test("TC-001", "cover.garage_door", "open_cover", "Open main garage door"),
+    service_test(
+        "TC-003",
+        "cover.garage_door",
+        "stop_cover",
+        "Stop main garage door",
+        min_delay=STOP_AFTER_TRAVEL,
+    ),
+    service_test("TC-002", "cover.garage_door", "close_cover", "Close main garage door"),
+    service_test("TC-004", "cover.internal_garage_door", "open_cover", "Open internal garage door"),
+    service_test(
+        "TC-006",
+        "cover.internal_garage_door",
+        "stop_cover",
+        "Stop internal garage door",
+        min_delay=STOP_AFTER_TRAVEL,
+    ),
+    service_test(
+        "TC-005", "cover.internal_garage_door", "close_cover", "Close internal garage door"
+    ),
+)
+SWITCH_TEST_PLAN = (
+    service_test("TC-007", "switch.gate_close_switch", "turn_on", "Turn on Gate close switch"),
+    service_test("TC-008", "switch.gate_close_switch", "turn_off", "Turn off Gate close switch"),
+    service_test("TC-009", "switch.gate_open_switch", "turn_on", "Turn on Gate open switch"),
+    service_test("TC-010", "switch.gate_open_switch", "turn_off", "Turn off Gate open switch"),
+    service_test(
+        "TC-011", "switch.gate_lock_open_switch", "turn_on", "Turn on Gate lock open switch"
+    ),
+    service_test(
+        "TC-012", "switch.gate_lock_open_switch", "turn_off", "Turn off Gate lock open switch"
+    ),
+    service_test(
+        "TC-013", "switch.internal_door_click", "turn_on", "Turn on Internal door click switch"
+    ),
+    service_test(
+        "TC-014", "switch.internal_door_click", "turn_off", "Turn off Internal door click switch"
+    ),
+)
+# Calls Home Assistant should reject; none of them reaches a device. Home Assistant
+# accepts service calls for unknown entities (HTTP 200 with no changed states), so
+# ETC-001 is advisory
+NEGATIVE_TEST_PLAN = (
+    service_test(
+        "ETC-001",
+        "cover.nonexistent_door",
+        "open_cover",
+        "Test invalid entity ID",
+        requests.codes.bad_request,
+        advisory=True,
+    ),
+    service_test(
+        "ETC-003",
+        "cover.garage_door",
+        "invalid_action",
+        "Test invalid service",
+        requests.codes.bad_request,
+    ),
+)
+
+
+class StateWatcher:
+    """Cache of entity states kept current from the state_changed event stream.
+
+    A background thread reads events from one WebSocket connection, so waiting
+    for an entity to change state needs no HTTP polling.
+    """
+
+    def __init__(self, ha_url: str, token: str, timeout: int = 10):
+        """Connect, subscribe to state changes and load the current states."""
+        self.states = {}
+        self.changed = threading.Condition()
+        self.websocket = HomeAssistantWebSocket(ha_url, token, timeout)
+        try:
+            self.websocket.command({"type": "subscribe_events", "event_type": "state_changed"})
+            # Events received before the snapshot are already reflected in it
+            for state in self.websocket.command({"type": "get_states"}) or []:
+                self.states[state["entity_id"]] = state.get("state")
+        except BaseException:
+            self.websocket.close()
+            raise
+        self.active = True
+        self.thread = threading.Thread(target=self._read_events, daemon=True)
+        self.thread.start()
+
+    def _read_events(self) -> None:
+        """Apply state_changed events to the cache until the connection ends."""
+        self.websocket.sock.settimeout(None)
+        try:
+            while True:
+                message = self.websocket.receive()
+                if message.get("type") != "event":
+                    continue
+                data = message.get("event", {}).get("data", {})
+                new_state = data.get("new_state") or {}
+                with self.changed:
+                    self.states[data.get("entity_id")] = new_state.get("state")
+                    self.changed.notify_all()
+        except (OSError, ValueError) as e:
+            if self.active:
+                logger.warning(f"⚠️  State watch stopped ({e}), falling back to polling")
+        finally:
+            with self.changed:
+                self.active = False
+                self.changed.notify_all()
+
+    def wait_for(self, entity_id: str, expected: set[str], timeout: float) -> Optional[bool]:
+        """Wait until the entity's state is one of expected.
+
+        Returns:
+            True if it got there, False on timeout, or None if the watch stopped
+            working and the caller has to find out some other way.
+        """
+        with self.changed:
+            reached = self.changed.wait_for(
+                lambda: self.states.get(entity_id) in expected or not self.active, timeout
+            )
+            if not self.active:
+                return None
+            return reached
+
+    def close(self) -> None:
+        """Close the connection, which also ends the reader thread."""
+        self.active = False
+        # Closing alone does not wake a recv() blocked in another thread; shutting the
+        # socket down does
+        with contextlib.suppress(OSError):  # Already disconnected
+            self.websocket.sock.shutdown(socket.SHUT_RDWR)
+        self.websocket.close()
+        self.thread.join(timeout=1)
+
+
+class ResponseFixtures:
+    """API responses recorded to, or replayed from, a JSON fixture file.
+
+    Each request maps to the responses it got, in order. Replaying a request returns
+    them in turn and then keeps repeating the last one, so state polls see the same
+    progression as the recorded run.
+    """
+
+    def __init__(self, filename: str, *, replay: bool):
+        """Start an empty recording, or load the fixture file to replay it."""
+        self.filename = filename
+        self.replaying = replay
+        self.responses: dict[str, list] = {}
+        self.replayed: dict[str, int] = {}
+        self.lock = threading.Lock()
+        if replay:
+            with open(filename) as f:
+                self.responses = json.load(f)
+
+    @staticmethod
+    def key(method: str, endpoint: str, data: Optional[dict]) -> str:
+        """Return the fixture key of a request."""
+        return f"{method} {endpoint} {json.dumps(data, sort_keys=True)}"
+
+    def record(self, key: str, response: tuple[int, dict, float]) -> None:
+        """Add a response to the recording."""
+        with self.lock:
+            self.responses.setdefault(key, []).append(list(response))
+
+    def replay(self, key: str) -> tuple[int, dict, float]:
+        """Return the next recorded response for key, as make_request would."""
+        with self.lock:
+            responses = self.responses.get(key)
+            if not responses:
+                return 0, {"error": f"No recorded response for {key}"}, 0.0
+            index = self.replayed.get(key, 0)
+            self.replayed[key] = index + 1
+            status_code, response_data, response_time = responses[min(index, len(responses) - 1)]
+        return status_code, response_data, response_time
+
+    def save(self) -> None:
+        """Write the recording to the fixture file."""
+        with open(self.filename, "w") as f:
+            json.dump(self.responses, f, indent=2)
+        logger.info(f"📼 Recorded responses saved to {self.filename}")
+
 
 class HomeAssistantTester:
     """Test runner for Home Assistant API calls."""
 
-    def __init__(self, ha_url: str, token: str, timeout: int = 10):
-        """Initialize the HomeAssistantTester class."""
+    def __init__(
+        self,
+        ha_url: str,
+        token: str,
+        timeout: int = 10,
+        *,
+        use_websocket: bool = False,
+        fixture_mode: Optional[str] = None,
+        fixture_file: str = "ha_fixtures.json",
+    ):
+        """Initialize the HomeAssistantTester class.
+
+        A fixture_mode of "record" saves every API response to fixture_file, and
+        "replay" answers requests from it without contacting Home Assistant.
+        """
         self.ha_url = ha_url.rstrip("/")
         self.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        # One session for all calls, so the whole run reuses the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry, pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
         self.timeout = timeout
         self.test_results = []
+        # Running totals kept by record_result, so summaries don't rescan the results
+        self.passed_tests = 0
+        self.timed_tests = 0
+        self.total_response_time = 0.0
+        self.results_lock = threading.Lock()
+        # Results store their time as an offset from here; it is only formatted as an
+        # ISO timestamp when the results are saved
+        self.start_epoch = time.time()
+        self.start_monotonic = time.monotonic()
+        # Entities from the last successful /api/states pull, by entity id
+        self.all_states: Optional[dict[str, dict]] = None
+        self.fixtures = None
+        if fixture_mode is not None:
+            self.fixtures = ResponseFixtures(fixture_file, replay=fixture_mode == "replay")
+
+        # With use_websocket, waits between tests follow state_changed events
+        # instead of polling the entity over REST
+        self.state_watcher = None
+        if use_websocket and self.fixtures is not None and self.fixtures.replaying:
+            logger.warning("⚠️  --use-websocket is ignored while replaying recorded responses")
+        elif use_websocket:
+            try:
+                self.state_watcher = StateWatcher(self.ha_url, token, timeout)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️  WebSocket unavailable ({e}), falling back to polling")
+
+    def __enter__(self) -> "HomeAssistantTester":
+        """Return the tester, closing its session when the block exits."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the HTTP session."""
+        self.close()
+
+    def close(self):
+        """Stop the worker threads and close the HTTP session and its pooled connections."""
+        if self.state_watcher is not None:
+            self.state_watcher.close()
+        self.executor.shutdown()
+        self.session.close()
+        if self.fixtures is not None and not self.fixtures.replaying:
+            self.fixtures.save()
 
     def make_request(
         self, method: str, endpoint: str, data: Optional[dict] = None
     ) -> tuple[int, dict, float]:
-        """Make HTTP request to Home Assistant API."""
+        """Make HTTP request to Home Assistant API, or replay or record its response."""
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if self.fixtures is None:
+            return self._send_request(method, endpoint, data)
+
+        key = self.fixtures.key(method, endpoint, data)
+        if self.fixtures.replaying:
+            return self.fixtures.replay(key)
+        response = self._send_request(method, endpoint, data)
+        self.fixtures.record(key, response)
+        return response
+
+    def _send_request(
+        self, method: str, endpoint: str, data: Optional[dict]
+    ) -> tuple[int, dict, float]:
+        """Send a request to Home Assistant and return its status, body and duration."""
         url = f"{self.ha_url}{endpoint}"
-        start_time = time.time()
-
+        start_time = time.monotonic()
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            end_time = time.time()
-            response_time = end_time - start_time
-
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"text": response.text}
-
-            else:
-                return response.status_code, response_data, response_time
-
+            response = self.session.request(method, url, json=data, timeout=self.timeout)
         except requests.exceptions.RequestException as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-            return 0, {"error": str(e)}, response_time
+            return 0, {"error": str(e)}, time.monotonic() - start_time
 
-    def test_cover_service(
-        self, entity_id: str, service: str, test_id: str, description: str
-    ) -> bool:
-        """Test cover service call."""
-        logger.info(f"Running {test_id}: {description}")
-
-        endpoint = f"/api/services/cover/{service}"
-        data = {"entity_id": entity_id}
-
-        status_code, response_data, response_time = self.make_request("POST", endpoint, data)
+        # Time from sending the request until its response headers were parsed, as
+        # measured by requests itself
+        response_time = response.elapsed.total_seconds()
 
-        success = status_code == requests.codes.ok
+        # json.loads takes the raw bytes, which skips the charset guessing and str copy
+        # that response.json() does first; requests already asks for gzip responses
+        try:
+            response_data = json.loads(response.content)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            response_data = {"text": response.text}
+
+        return response.status_code, response_data, response_time
+
+    def record_result(self, result: dict) -> None:
+        """Store a test result and add it to the running totals."""
+        with self.results_lock:
+            self.test_results.append(result)
+            self.passed_tests += result["success"]
+            # Snapshot lookups made no request of their own, so they have no timing
+            if not result.get("from_snapshot"):
+                self.timed_tests += 1
+                self.total_response_time += result["response_time"]
+
+    def run_spec(self, spec: TestSpec) -> bool:
+        """Run one service call of the test plan and record its result."""
+        logger.info("Running %s: %s", spec.test_id, spec.description)
+
+        data = {"entity_id": spec.entity_id}
+        status_code, response_data, response_time = self.make_request(
+            spec.method, spec.endpoint, data
+        )
+
+        success = status_matches(status_code, spec.expected_status)
+        warning = None
+        # Only an accepted call is forgiven; transport errors and 5xx still fail
+        if (
+            not success
+            and spec.advisory
+            and requests.codes.ok <= status_code < requests.codes.multiple_choices
+        ):
+            warning = f"expected HTTP {spec.expected_status}, got {status_code}"
+            success = True
         result = {
-            "test_id": test_id,
-            "description": description,
-            "endpoint": endpoint,
-            "entity_id": entity_id,
-            "service": service,
+            "test_id": spec.test_id,
+            "description": spec.description,
+            "endpoint": spec.endpoint,
+            "entity_id": spec.entity_id,
+            "service": spec.service,
             "status_code": status_code,
             "response_time": response_time,
             "success": success,
             "response_data": response_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_offset": time.monotonic() - self.start_monotonic,
         }
+        if warning:
+            result["warning"] = warning
 
-        self.test_results.append(result)
+        self.record_result(result)
 
-        if success:
-            logger.info(f"✅ {test_id} passed ({response_time:.3f}s)")
+        if warning:
+            logger.warning("⚠️  %s: %s (%.3fs)", spec.test_id, warning, response_time)
+        elif success:
+            logger.info("✅ %s passed (%.3fs)", spec.test_id, response_time)
         else:
-            logger.error(f"❌ {test_id} failed: HTTP {status_code} ({response_time:.3f}s)")
-            logger.error(f"   Response: {response_data}")
+            logger.error("❌ %s failed: HTTP %s (%.3fs)", spec.test_id, status_code, response_time)
+            logger.error("   Response: %s", response_data)
 
         return success
 
-    def test_switch_service(
-        self, entity_id: str, service: str, test_id: str, description: str
-    ) -> bool:
-        """Test switch service call."""
-        logger.info(f"Running {test_id}: {description}")
+    def run_plan(self, plan: tuple[TestSpec, ...], max_wait: float) -> int:
+        """Run service calls in order, letting each take effect before the next one.
 
-        endpoint = f"/api/services/switch/{service}"
-        data = {"entity_id": entity_id}
+        Args:
+            plan: Service calls to run.
+            max_wait: Longest wait, in seconds, for a call to show up in the state.
 
-        status_code, response_data, response_time = self.make_request("POST", endpoint, data)
+        Returns:
+            The number of failed tests.
+        """
+        failed_tests = 0
+        sent_at = time.monotonic()
+        for index, spec in enumerate(plan):
+            if index > 0:
+                # Brief delay between tests, until the previous call took effect
+                previous = plan[index - 1]
+                self.wait_until_state(
+                    previous.entity_id, SETTLED_STATES[previous.service], max_wait
+                )
+                remaining = sent_at + spec.min_delay - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+            sent_at = time.monotonic()
+            if not self.run_spec(spec):
+                failed_tests += 1
+        return failed_tests
 
-        success = status_code == requests.codes.ok
-        result = {
-            "test_id": test_id,
-            "description": description,
-            "endpoint": endpoint,
-            "entity_id": entity_id,
-            "service": service,
-            "status_code": status_code,
-            "response_time": response_time,
-            "success": success,
-            "response_data": response_data,
-            "timestamp": datetime.now().isoformat(),
-        }
+    def test_cover_service(
+        self, entity_id: str, service: str, test_id: str, description: str
+    ) -> bool:
+        """Test cover service call."""
+        return self.run_spec(
+            TestSpec(
+                test_id, "POST", f"/api/services/cover/{service}", entity_id, service, description
+            )
+        )
 
-        self.test_results.append(result)
+    def test_switch_service(
+        self, entity_id: str, service: str, test_id: str, description: str
+    ) -> bool:
+        """Test switch service call."""
+        return self.run_spec(
+            TestSpec(
+                test_id, "POST", f"/api/services/switch/{service}", entity_id, service, description
+            )
+        )
 
-        if success:
-            logger.info(f"✅ {test_id} passed ({response_time:.3f}s)")
+    def test_entity_state(
+        self, entity_id: str, test_id: str, description: str, *, from_snapshot: bool = False
+    ) -> bool:
+        """Test getting entity state.
+
+        With from_snapshot, the entity is looked up in the last /api/states pull
+        instead of requesting /api/states/<entity_id>, if there is one.
+        """
+        logger.info("Running %s: %s", test_id, description)
+
+        snapshot = from_snapshot and self.all_states is not None
+        if snapshot:
+            endpoint = "/api/states"
+            response_data = self.all_states.get(entity_id)
+            if response_data is not None:
+                status_code = requests.codes.ok
+            else:
+                status_code = requests.codes.not_found
+                response_data = {"message": "Entity not found in /api/states"}
+            response_time = 0.0
         else:
-            logger.error(f"❌ {test_id} failed: HTTP {status_code} ({response_time:.3f}s)")
-            logger.error(f"   Response: {response_data}")
-
-        return success
-
-    def test_entity_state(self, entity_id: str, test_id: str, description: str) -> bool:
-        """Test getting entity state."""
-        logger.info(f"Running {test_id}: {description}")
-
-        endpoint = f"/api/states/{entity_id}"
-
-        status_code, response_data, response_time = self.make_request("GET", endpoint)
+            endpoint = f"/api/states/{entity_id}"
+            status_code, response_data, response_time = self.make_request("GET", endpoint)
 
         success = status_code == requests.codes.ok
         result = {
@@ -156,23 +554,29 @@ class HomeAssistantTester:
             "response_time": response_time,
             "success": success,
             "response_data": response_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_offset": time.monotonic() - self.start_monotonic,
         }
+        if snapshot:
+            # Shares the TC-015 request, so it has no response time of its own
+            result["from_snapshot"] = True
 
-        self.test_results.append(result)
+        self.record_result(result)
 
-        if success:
+        if success and snapshot:
             state = response_data.get("state", "unknown")
-            logger.info(f"✅ {test_id} passed ({response_time:.3f}s) - State: {state}")
+            logger.info("✅ %s passed (from /api/states snapshot) - State: %s", test_id, state)
+        elif success:
+            state = response_data.get("state", "unknown")
+            logger.info("✅ %s passed (%.3fs) - State: %s", test_id, response_time, state)
         else:
-            logger.error(f"❌ {test_id} failed: HTTP {status_code} ({response_time:.3f}s)")
-            logger.error(f"   Response: {response_data}")
+            logger.error("❌ %s failed: HTTP %s (%.3fs)", test_id, status_code, response_time)
+            logger.error("   Response: %s", response_data)
 
         return success
 
     def test_all_states(self, test_id: str, description: str) -> bool:
         """Test getting all entity states."""
-        logger.info(f"Running {test_id}: {description}")
+        logger.info("Running %s: %s", test_id, description)
 
         endpoint = "/api/states"
 
@@ -180,6 +584,8 @@ class HomeAssistantTester:
 
         success = status_code == requests.codes.ok
         entity_count = len(response_data) if isinstance(response_data, list) else 0
+        if success and isinstance(response_data, list):
+            self.all_states = {entity["entity_id"]: entity for entity in response_data}
 
         result = {
             "test_id": test_id,
@@ -191,67 +597,58 @@ class HomeAssistantTester:
             "response_time": response_time,
             "success": success,
             "entity_count": entity_count,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_offset": time.monotonic() - self.start_monotonic,
         }
 
-        self.test_results.append(result)
+        self.record_result(result)
 
         if success:
             logger.info(
-                f"✅ {test_id} passed ({response_time:.3f}s) - Found {entity_count} entities"
+                "✅ %s passed (%.3fs) - Found %d entities", test_id, response_time, entity_count
             )
         else:
-            logger.error(f"❌ {test_id} failed: HTTP {status_code} ({response_time:.3f}s)")
-            logger.error(f"   Response: {response_data}")
+            logger.error("❌ %s failed: HTTP %s (%.3fs)", test_id, status_code, response_time)
+            logger.error("   Response: %s", response_data)
 
         return success
 
+    def wait_until_state(self, entity_id: str, expected: set[str], max_wait: float = 2.0) -> bool:
+        """Wait for an entity's state to be one of expected, for at most max_wait seconds.
+
+        Follows the state watcher when there is one, and polls the entity otherwise.
+
+        Returns:
+            True if the entity reached an expected state, False on timeout.
+        """
+        deadline = time.monotonic() + max_wait
+        if self.state_watcher is not None:
+            reached = self.state_watcher.wait_for(entity_id, expected, max_wait)
+            if reached is not None:
+                if not reached:
+                    logger.debug(
+                        "%s did not reach %s within %ss", entity_id, sorted(expected), max_wait
+                    )
+                return reached
+            self.state_watcher = None
+        while True:
+            status_code, response_data, _ = self.make_request("GET", f"/api/states/{entity_id}")
+            if status_code == requests.codes.ok and response_data.get("state") in expected:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.debug(
+                    "%s did not reach %s within %ss", entity_id, sorted(expected), max_wait
+                )
+                return False
+            time.sleep(min(STATE_POLL_INTERVAL, remaining))
+
     def run_basic_cover_tests(self) -> int:
         """Run basic cover entity tests."""
         logger.info("=" * 60)
         logger.info("RUNNING COVER ENTITY TESTS")
         logger.info("=" * 60)
 
-        failed_tests = 0
-
-        # Main garage door tests
-        if not self.test_cover_service(
-            "cover.garage_door", "open_cover", "TC-001", "Open main garage door"
-        ):
-            failed_tests += 1
-        time.sleep(2)  # Brief delay between tests
-
-        if not self.test_cover_service(
-            "cover.garage_door", "stop_cover", "TC-003", "Stop main garage door"
-        ):
-            failed_tests += 1
-        time.sleep(2)
-
-        if not self.test_cover_service(
-            "cover.garage_door", "close_cover", "TC-002", "Close main garage door"
-        ):
-            failed_tests += 1
-        time.sleep(2)
-
-        # Internal garage door tests
-        if not self.test_cover_service(
-            "cover.internal_garage_door", "open_cover", "TC-004", "Open internal garage door"
-        ):
-            failed_tests += 1
-        time.sleep(2)
-
-        if not self.test_cover_service(
-            "cover.internal_garage_door", "stop_cover", "TC-006", "Stop internal garage door"
-        ):
-            failed_tests += 1
-        time.sleep(2)
-
-        if not self.test_cover_service(
-            "cover.internal_garage_door", "close_cover", "TC-005", "Close internal garage door"
-        ):
-            failed_tests += 1
-
-        return failed_tests
+        return self.run_plan(COVER_TEST_PLAN, max_wait=2.0)
 
     def run_basic_switch_tests(self) -> int:
         """Run basic switch entity tests."""
@@ -259,49 +656,20 @@ class HomeAssistantTester:
         logger.info("RUNNING SWITCH ENTITY TESTS")
         logger.info("=" * 60)
 
-        failed_tests = 0
-        switches = [
-            ("switch.gate_close_switch", "Gate close switch"),
-            ("switch.gate_open_switch", "Gate open switch"),
-            ("switch.gate_lock_open_switch", "Gate lock open switch"),
-            ("switch.internal_door_click", "Internal door click switch"),
-        ]
+        return self.run_plan(SWITCH_TEST_PLAN, max_wait=1.0)
 
-        test_counter = 7  # Starting from TC-007
+    def run_state_tests(self, *, per_entity_requests: bool = True) -> int:
+        """Run entity state verification tests.
 
-        for entity_id, description in switches:
-            # Test turn on
-            if not self.test_switch_service(
-                entity_id, "turn_on", f"TC-{test_counter:03d}", f"Turn on {description}"
-            ):
-                failed_tests += 1
-            time.sleep(1)
-
-            # Test turn off
-            if not self.test_switch_service(
-                entity_id, "turn_off", f"TC-{test_counter+1:03d}", f"Turn off {description}"
-            ):
-                failed_tests += 1
-            time.sleep(1)
-
-            test_counter += 2
-
-        return failed_tests
-
-    def run_state_tests(self) -> int:
-        """Run entity state verification tests."""
+        Args:
+            per_entity_requests: Check each entity through /api/states/<entity_id>,
+                as the test plan does. When False, the entities are looked up in the
+                TC-015 /api/states response instead, saving one request per entity.
+        """
         logger.info("=" * 60)
         logger.info("RUNNING STATE VERIFICATION TESTS")
         logger.info("=" * 60)
 
-        failed_tests = 0
-
-        # Test all states
-        if not self.test_all_states("TC-015", "Get all entity states"):
-            failed_tests += 1
-
-        time.sleep(1)
-
         # Test specific entity states
         entities = [
             ("cover.garage_door", "Get main garage door state"),
@@ -312,52 +680,56 @@ class HomeAssistantTester:
             ("switch.internal_door_click", "Get internal door click switch state"),
         ]
 
-        for entity_id, description in entities:
-            if not self.test_entity_state(
-                entity_id, f"TC-016-{entity_id.split('.')[-1]}", description
-            ):
-                failed_tests += 1
-            time.sleep(0.5)
+        if not per_entity_requests:
+            failed_tests = 0 if self.test_all_states("TC-015", "Get all entity states") else 1
+            for entity_id, description in entities:
+                if not self.test_entity_state(
+                    entity_id,
+                    f"TC-016-{entity_id.split('.')[-1]}",
+                    description,
+                    from_snapshot=True,
+                ):
+                    failed_tests += 1
+            return failed_tests
+
+        # Reads don't change anything on the devices, so they all run concurrently
+        first_result = len(self.test_results)
+        futures = [self.executor.submit(self.test_all_states, "TC-015", "Get all entity states")]
+        futures += [
+            self.executor.submit(
+                self.test_entity_state, entity_id, f"TC-016-{entity_id.split('.')[-1]}", description
+            )
+            for entity_id, description in entities
+        ]
+        failed_tests = sum(not future.result() for future in futures)
+
+        order = ["TC-015"] + [f"TC-016-{entity_id.split('.')[-1]}" for entity_id, _ in entities]
+        self.sort_results_since(first_result, order)
 
         return failed_tests
 
+    def sort_results_since(self, first_result: int, order: list[str]) -> None:
+        """Put the results recorded from index first_result on in the given test id order.
+
+        Tests run concurrently record their results in completion order; this puts
+        them back in the order they are listed in.
+        """
+        self.test_results[first_result:] = sorted(
+            self.test_results[first_result:], key=lambda result: order.index(result["test_id"])
+        )
+
     def run_error_tests(self) -> int:
         """Run error condition tests."""
         logger.info("=" * 60)
         logger.info("RUNNING ERROR CONDITION TESTS")
         logger.info("=" * 60)
 
-        failed_tests = 0
-
-        # Test invalid entity ID (should fail)
-        logger.info("Running ETC-001: Test invalid entity ID")
-        endpoint = "/api/services/cover/open_cover"
-        data = {"entity_id": "cover.nonexistent_door"}
-
-        status_code, response_data, response_time = self.make_request("POST", endpoint, data)
-
-        # This should fail (we expect it to fail)
-        if status_code == requests.codes.ok:
-            logger.warning(f"⚠️  ETC-001: Expected failure but got success (HTTP {status_code})")
-        else:
-            logger.info(
-                f"✅ ETC-001 passed: Correctly rejected invalid entity (HTTP {status_code})"
-            )
-
-        # Test invalid service (should fail)
-        logger.info("Running ETC-003: Test invalid service")
-        endpoint = "/api/services/cover/invalid_action"
-        data = {"entity_id": "cover.garage_door"}
-
-        status_code, response_data, response_time = self.make_request("POST", endpoint, data)
-
-        # This should fail (we expect it to fail)
-        if status_code == requests.codes.ok:
-            logger.warning(f"⚠️  ETC-003: Expected failure but got success (HTTP {status_code})")
-        else:
-            logger.info(
-                f"✅ ETC-003 passed: Correctly rejected invalid service (HTTP {status_code})"
-            )
+        # Home Assistant rejects these without touching a device, so they run concurrently
+        first_result = len(self.test_results)
+        failed_tests = sum(
+            not passed for passed in self.executor.map(self.run_spec, NEGATIVE_TEST_PLAN)
+        )
+        self.sort_results_since(first_result, [spec.test_id for spec in NEGATIVE_TEST_PLAN])
 
         return failed_tests
 
@@ -386,19 +758,22 @@ class HomeAssistantTester:
 
         return total_failed
 
+    def summarize_results(self) -> tuple[int, int, float]:
+        """Return the total and passed test counts and the average response time.
+
+        The average only covers tests that made a request of their own.
+        """
+        total_tests = len(self.test_results)
+        avg_response_time = (
+            self.total_response_time / self.timed_tests if self.timed_tests > 0 else 0
+        )
+        return total_tests, self.passed_tests, avg_response_time
+
     def generate_report(self) -> str:
         """Generate test report."""
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
+        total_tests, passed_tests, avg_response_time = self.summarize_results()
         failed_tests = total_tests - passed_tests
 
-        if total_tests > 0:
-            avg_response_time = (
-                sum(result["response_time"] for result in self.test_results) / total_tests
-            )
-        else:
-            avg_response_time = 0
-
         report = f"""
 {'='*80}
 HOME ASSISTANT API TEST REPORT
@@ -414,42 +789,56 @@ Test Summary:
 Test Results:
 """
 
+        # Collect the per-test and failure lines in one pass, and join them once
+        parts = [report]
+        failure_details = []
         for result in self.test_results:
-            status = "✅ PASS" if result["success"] else "❌ FAIL"
-            report += (
-                f"  {result['test_id']}: {status} ({result['response_time']:.3f}s) - "
-                f"{result['description']}\n"
-            )
-
-        if failed_tests > 0:
-            report += "\nFailed Tests Details:\n"
-            for result in self.test_results:
-                if not result["success"]:
-                    report += (
-                        f"  {result['test_id']}: HTTP {result['status_code']} - "
-                        f"{result.get('response_data', {})}\n"
-                    )
-
-        report += f"\nTest completed at: {datetime.now().isoformat()}\n"
-        report += "=" * 80
-
-        return report
+            if "warning" in result:
+                status = "⚠️  WARN"
+            else:
+                status = "✅ PASS" if result["success"] else "❌ FAIL"
+            if result.get("from_snapshot"):
+                timing = "from /api/states snapshot"
+            else:
+                timing = f"{result['response_time']:.3f}s"
+            parts.append(f"  {result['test_id']}: {status} ({timing}) - {result['description']}\n")
+            if not result["success"]:
+                failure_details.append(
+                    f"  {result['test_id']}: HTTP {result['status_code']} - "
+                    f"{result.get('response_data', {})}\n"
+                )
+
+        if failure_details:
+            parts.append("\nFailed Tests Details:\n")
+            parts.extend(failure_details)
+
+        parts.append(f"\nTest completed at: {datetime.now().isoformat()}\n")
+        parts.append("=" * 80)
+
+        return "".join(parts)
+
+    def export_result(self, result: dict) -> dict:
+        """Return a copy of result with its time offset formatted as an ISO timestamp."""
+        exported = {key: value for key, value in result.items() if key != "timestamp_offset"}
+        exported["timestamp"] = datetime.fromtimestamp(
+            self.start_epoch + result["timestamp_offset"]
+        ).isoformat()
+        return exported
 
     def save_detailed_results(self, filename: str = "ha_test_detailed_results.json"):
         """Save detailed test results to JSON file."""
+        total_tests, passed_tests, _ = self.summarize_results()
         with open(filename, "w") as f:
             json.dump(
                 {
                     "test_run_info": {
                         "ha_url": self.ha_url,
-                        "total_tests": len(self.test_results),
-                        "passed_tests": sum(1 for result in self.test_results if result["success"]),
-                        "failed_tests": sum(
-                            1 for result in self.test_results if not result["success"]
-                        ),
+                        "total_tests": total_tests,
+                        "passed_tests": passed_tests,
+                        "failed_tests": total_tests - passed_tests,
                         "execution_time": datetime.now().isoformat(),
                     },
-                    "test_results": self.test_results,
+                    "test_results": [self.export_result(result) for result in self.test_results],
                 },
                 f,
                 indent=2,
@@ -457,6 +846,29 @@ Test Results:
         logger.info(f"📄 Detailed results saved to {filename}")
 
 
+def setup_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue to the file and console handlers.
+
+    Records are formatted as they are logged and then written by a background thread,
+    so logging never blocks on I/O between tests. Stopping the returned listener
+    writes out whatever is still queued.
+    """
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler("ha_test_results.log"),
+        logging.StreamHandler(),
+        respect_handler_level=True,
+    )
+    log_listener.start()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+    return log_listener
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Home Assistant API Test Runner for Garage Door Controller"
@@ -474,46 +886,92 @@ def main():
     parser.add_argument(
         "--states-only", action="store_true", help="Run only state verification tests"
     )
+    parser.add_argument(
+        "--use-websocket",
+        action="store_true",
+        help="Wait for state changes over the WebSocket API instead of polling",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record",
+        dest="fixture_mode",
+        action="store_const",
+        const="record",
+        help="Save every API response to the fixture file",
+    )
+    fixtures.add_argument(
+        "--replay",
+        dest="fixture_mode",
+        action="store_const",
+        const="replay",
+        help="Answer API requests from the fixture file instead of Home Assistant",
+    )
+    parser.add_argument(
+        "--fixture-file",
+        default="ha_fixtures.json",
+        help="Fixture file for --record and --replay (default: ha_fixtures.json)",
+    )
 
     args = parser.parse_args()
+    if args.fixture_mode == "replay" and not os.path.exists(args.fixture_file):
+        parser.error(f"fixture file not found: {args.fixture_file}")
 
-    # Create tester instance
-    tester = HomeAssistantTester(args.url, args.token, args.timeout)
-
+    log_listener = setup_logging()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
     try:
-        failed_tests = 0
-
-        if args.quick:
-            logger.info("🏃 Running quick test suite")
-            failed_tests += tester.run_state_tests()
-        elif args.covers_only:
-            failed_tests += tester.run_basic_cover_tests()
-        elif args.switches_only:
-            failed_tests += tester.run_basic_switch_tests()
-        elif args.states_only:
-            failed_tests += tester.run_state_tests()
-        else:
-            failed_tests = tester.run_all_tests()
+        run_tests(args)
+    finally:
+        # Write out the records still queued, including after sys.exit
+        log_listener.stop()
+
+
+def run_tests(args: argparse.Namespace) -> None:
+    """Run the test suites selected on the command line and exit with their status."""
+    # Create tester instance; its HTTP session is closed on the way out
+    with HomeAssistantTester(
+        args.url,
+        args.token,
+        args.timeout,
+        use_websocket=args.use_websocket,
+        fixture_mode=args.fixture_mode,
+        fixture_file=args.fixture_file,
+    ) as tester:
+        try:
+            failed_tests = 0
+
+            if args.quick:
+                logger.info("🏃 Running quick test suite")
+                failed_tests += tester.run_state_tests(per_entity_requests=False)
+            elif args.covers_only:
+                failed_tests += tester.run_basic_cover_tests()
+            elif args.switches_only:
+                failed_tests += tester.run_basic_switch_tests()
+            elif args.states_only:
+                failed_tests += tester.run_state_tests()
+            else:
+                failed_tests = tester.run_all_tests()
 
-        # Generate and display report
-        report = tester.generate_report()
-        print(report)
+            # Generate and display report
+            report = tester.generate_report()
+            print(report)
 
-        # Save detailed results
-        tester.save_detailed_results()
+            # Save detailed results
+            tester.save_detailed_results()
 
-        # Exit with appropriate code
-        if failed_tests == -1:
-            sys.exit(2)  # Interrupted or error
-        elif failed_tests > 0:
-            sys.exit(1)  # Some tests failed
-        else:
-            logger.info("🎉 All tests passed!")
-            sys.exit(0)  # All tests passed
+            # Exit with appropriate code
+            if failed_tests == -1:
+                sys.exit(2)  # Interrupted or error
+            elif failed_tests > 0:
+                sys.exit(1)  # Some tests failed
+            else:
+                logger.info("🎉 All tests passed!")
+                sys.exit(0)  # All tests passed
 
-    except Exception:
-        logger.exception("❌ Test runner failed")
-        sys.exit(2)
+        except Exception:
+            logger.exception("❌ Test runner failed")
+            sys.exit(2)
 
 
 if __name__ == "__main__":
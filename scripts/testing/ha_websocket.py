@@ -0,0 +1,188 @@
+"""Minimal Home Assistant WebSocket API client.
+
+Shared by ha_test_runner.py and door_cycler.py, which import it from this
+directory when run as scripts.
+"""
+
+import base64
+import json
+import os
+import socket
+import ssl
+import time
+import urllib.parse
+from typing import Optional
+
+
+# WebSocket frame opcodes (RFC 6455) and the 7-bit length values that announce an
+# extended 16 or 64-bit payload length
+WS_CONTINUATION, WS_TEXT, WS_CLOSE, WS_PING, WS_PONG = 0x0, 0x1, 0x8, 0x9, 0xA
+WS_LENGTH_16, WS_LENGTH_64 = 126, 127
+
+
+class HomeAssistantWebSocket:
+    """Minimal client for the Home Assistant WebSocket API.
+
+    Implements just the parts of RFC 6455 the API needs (masked text frames out,
+    unfragmented or fragmented text frames in, ping/pong and close), so no extra
+    dependency is required.
+    """
+
+    def __init__(self, ha_url: str, token: str, timeout: int = 10):
+        """Connect to the API and authenticate with the long-lived access token."""
+        parsed = urllib.parse.urlsplit(ha_url)
+        secure = parsed.scheme == "https"
+        host = parsed.hostname or "localhost"
+        port = parsed.port or (443 if secure else 80)
+
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        if secure:
+            context = ssl.create_default_context()
+            self.sock = context.wrap_socket(self.sock, server_hostname=host)
+        self.buffer = bytearray()
+        self.next_id = 1
+
+        try:
+            self._handshake(parsed.netloc, f"{parsed.path.rstrip('/')}/api/websocket")
+            self._authenticate(token)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "HomeAssistantWebSocket":
+        """Return the connected client."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying socket."""
+        self.sock.close()
+
+    def _handshake(self, netloc: str, path: str) -> None:
+        """Upgrade the HTTP connection to a WebSocket."""
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall(
+            (
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {netloc}\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n"
+            ).encode()
+        )
+        while b"\r\n\r\n" not in self.buffer:
+            self._fill()
+        head, _, rest = bytes(self.buffer).partition(b"\r\n\r\n")
+        self.buffer = bytearray(rest)
+        status = head.split(b"\r\n", 1)[0]
+        if status.split(b" ")[1:2] != [b"101"]:
+            raise ConnectionError(f"WebSocket upgrade refused: {status.decode(errors='replace')}")
+
+    def _authenticate(self, token: str) -> None:
+        """Answer the auth_required greeting with the access token."""
+        self.receive()  # auth_required
+        self.send({"type": "auth", "access_token": token})
+        reply = self.receive()
+        if reply.get("type") != "auth_ok":
+            raise ConnectionError(f"authentication failed: {reply.get('message', reply)}")
+
+    def _fill(self) -> None:
+        """Read more data from the socket into the buffer."""
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("WebSocket connection closed")
+        self.buffer += chunk
+
+    def _read(self, size: int) -> bytes:
+        """Consume exactly size bytes from the connection."""
+        while len(self.buffer) < size:
+            self._fill()
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def _send_frame(self, opcode: int, payload: bytes) -> None:
+        """Send a single masked frame, as required for client-to-server frames."""
+        length = len(payload)
+        header = bytearray([0x80 | opcode])
+        if length < WS_LENGTH_16:
+            header.append(0x80 | length)
+        elif length < 1 << 16:
+            header.append(0x80 | WS_LENGTH_16)
+            header += length.to_bytes(2, "big")
+        else:
+            header.append(0x80 | WS_LENGTH_64)
+            header += length.to_bytes(8, "big")
+        mask = os.urandom(4)
+        key = (mask * (length // 4 + 1))[:length]
+        masked = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(
+            length, "big"
+        )
+        self.sock.sendall(bytes(header) + mask + masked)
+
+    def send(self, message: dict) -> None:
+        """Send a JSON message."""
+        self._send_frame(WS_TEXT, json.dumps(message).encode())
+
+    def receive(self, timeout: Optional[float] = None) -> dict:
+        """Return the next JSON message, answering pings on the way.
+
+        Raises:
+            socket.timeout: If no complete message arrives within timeout seconds.
+        """
+        if timeout is not None:
+            self.sock.settimeout(timeout)
+        message = b""
+        while True:
+            first, second = self._read(2)
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == WS_LENGTH_16:
+                length = int.from_bytes(self._read(2), "big")
+            elif length == WS_LENGTH_64:
+                length = int.from_bytes(self._read(8), "big")
+            payload = self._read(length)  # Server frames are never masked
+
+            if opcode == WS_CLOSE:
+                raise ConnectionError("WebSocket closed by server")
+            if opcode == WS_PING:
+                self._send_frame(WS_PONG, payload)
+            elif opcode in (WS_CONTINUATION, WS_TEXT):
+                message += payload
+                if first & 0x80:
+                    return json.loads(message)
+
+    def command(self, message: dict):
+        """Send a command and return its result, skipping any events received meanwhile.
+
+        Raises:
+            ConnectionError: If Home Assistant reports the command as failed.
+        """
+        command_id = self.next_id
+        self.next_id += 1
+        self.send({"id": command_id, **message})
+        while True:
+            reply = self.receive()
+            if reply.get("id") == command_id and reply.get("type") == "result":
+                if not reply.get("success"):
+                    raise ConnectionError(f"{message['type']} failed: {reply.get('error')}")
+                return reply.get("result")
+
+    def subscribe_state_changes(self) -> None:
+        """Subscribe to state_changed events and wait for the confirmation."""
+        self.command({"type": "subscribe_events", "event_type": "state_changed"})
+
+    def next_state_change(self, timeout: float) -> tuple[str, Optional[str]]:
+        """Return (entity_id, new state) for the next state_changed event."""
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self.receive(max(deadline - time.monotonic(), 0.001))
+            if message.get("type") != "event":
+                continue
+            data = message.get("event", {}).get("data", {})
+            new_state = data.get("new_state") or {}
+            return data.get("entity_id", ""), new_state.get("state")